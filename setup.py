@@ -1,5 +1,8 @@
 import os
+import re
 import sys
+import hashlib
+import shutil
 import sysconfig
 import subprocess
 
@@ -8,15 +11,44 @@ from setuptools import setup, find_packages
 from pybind11.setup_helpers import Pybind11Extension, build_ext
 
 import pyarrow as pa
-pa.create_library_symlinks()
+
+
+def _env_flag(name):
+    """
+    Returns True if the environment variable `name` is set to a value
+    other than an empty string, "0", "false" or "no" (case insensitive).
+    """
+    return os.environ.get(name, '').lower() not in ('', '0', 'false', 'no')
+
 
 is_cibuildwheel = bool(os.environ.get('CIBUILDWHEEL', False))
+# Optimize the core cpp library for the CPU of the build machine.
+# Produces non-portable binaries, hence never enabled for distributed wheels.
+is_native_build = _env_flag('VINUM_NATIVE') and not is_cibuildwheel
 
 with open("README.rst", "r") as f:
     long_description = f.read()
 
+
+def _read_version():
+    """
+    Returns `__version__` defined in vinum/_version.py,
+    the single source of the package version.
+    """
+    with open(os.path.join("vinum", "_version.py"), "r") as f:
+        match = re.search(
+            r"^__version__(?:\s*:\s*str)?\s*=\s*['\"]([^'\"]+)['\"]",
+            f.read(),
+            re.MULTILINE
+        )
+    if not match:
+        raise RuntimeError("__version__ is not found in vinum/_version.py")
+    return match.group(1)
+
+
+VERSION = _read_version()
+
 NAME = "vinum"
-VERSION = "0.3.2"
 AUTHOR = "Dmitry Koval"
 AUTHOR_EMAIL = "dima@koval.space"
 DESCRIPTION = (
@@ -34,8 +66,16 @@ INSTALL_REQUIRES = [
     "numpy >= 1.19.0",
     "pglast == 1.17",
 ]
+
+EXTRAS_REQUIRE = {
+    "numba": ["numba >= 0.53"],
+}
 VINUM_CPP_LIB_NAME = 'vinum_cpp'
 
+ARROW_INCLUDE_DIR = pa.get_include()
+ARROW_LIBRARY_DIRS = tuple(pa.get_library_dirs())
+ARROW_LIBRARIES = tuple(pa.get_libraries())
+
 
 # CMakeExtension and CMakeBuild are adapted from:
 # https://github.com/pybind/cmake_example
@@ -57,6 +97,9 @@ class CMakeBuild(build_ext):
     Second, it build the Pybind11 wrapper and publishes it as a shared lib.
     """
 
+    # Stores the hash of the arguments of the last successful CMake configure
+    CMAKE_CONFIGURE_HASH_FILE = ".vinum_cmake_args.sha"
+
     # Convert distutils Windows platform specifiers to CMake -A arguments
     MSVC_CMAKE_PLATFORM = {
         "win32": "Win32",
@@ -80,24 +123,52 @@ class CMakeBuild(build_ext):
             f"-DCMAKE_LIBRARY_OUTPUT_DIRECTORY={extdir}",
             f"-DCMAKE_ARCHIVE_OUTPUT_DIRECTORY={extdir}",
             f"-DCMAKE_BUILD_TYPE={cfg}",  # not used on MSVC, but no harm
-            f"-DARROW_INCLUDE_DIR={pa.get_include()}",
+            f"-DARROW_INCLUDE_DIR={ARROW_INCLUDE_DIR}",
             f"-DCMAKE_VERBOSE_MAKEFILE:BOOL=ON",
+            f"-DCMAKE_EXPORT_COMPILE_COMMANDS:BOOL=ON",
+            f"-DVINUM_ENABLE_PCH:BOOL=ON",
         ]
         if ext.cmake_cxx_flags:
             cmake_args.append(
                 f"-DCMAKE_CXX_FLAGS={' '.join(ext.cmake_cxx_flags)}"
             )
 
+        # Use ccache, if available, so that unchanged translation units
+        # are not recompiled on every build.
+        # Set VINUM_DISABLE_CCACHE environment variable to opt-out.
+        build_env = os.environ.copy()
+        ccache = (
+            None if _env_flag("VINUM_DISABLE_CCACHE")
+            else shutil.which("ccache")
+        )
+        if ccache:
+            cmake_args += [
+                f"-DCMAKE_CXX_COMPILER_LAUNCHER={ccache}",
+                f"-DCMAKE_C_COMPILER_LAUNCHER={ccache}",
+            ]
+            # Compare compilers by content, to avoid false cache misses
+            # when the toolchain is updated in place.
+            build_env.setdefault("CCACHE_COMPILERCHECK", "content")
+            # Required for ccache to work with precompiled headers.
+            build_env.setdefault("CCACHE_SLOPPINESS",
+                                 "pch_defines,time_macros,include_file_mtime")
+
         build_args = [
             "--target",
             ext.cmake_target_name
         ]
 
-        if self.compiler.compiler_type == "msvc":
-            # CMake lets you override the generator - we need to check this.
-            # Can be set with Conda-Build, for example.
-            cmake_generator = os.environ.get("CMAKE_GENERATOR", "")
+        # CMake lets you override the generator - we need to check this.
+        # Can be set with Conda-Build, for example.
+        cmake_generator = os.environ.get("CMAKE_GENERATOR", "")
+
+        # Prefer Ninja on all platforms when it's available and
+        # the generator is not set explicitly.
+        if not cmake_generator and shutil.which("ninja"):
+            cmake_generator = "Ninja"
+            cmake_args += ["-GNinja"]
 
+        if self.compiler.compiler_type == "msvc":
             # Single config generators are handled "normally"
             single_config = any(
                 x in cmake_generator for x in {"NMake", "Ninja"}
@@ -118,7 +189,7 @@ class CMakeBuild(build_ext):
             # Multi-config generators have a different way to specify configs
             if not single_config:
                 cmake_args += [
-                    f"-DCMAKE_LIBRARY_OUTPUT_DIRECTORY_{cfg.upper()}={extdir}"
+                    f"-DCMAKE_LIBRARY_OUTPUT_DIRECTORY_{cfg.upper()}={extdir}",
                     f"-DCMAKE_ARCHIVE_OUTPUT_DIRECTORY_{cfg.upper()}={extdir}"
                 ]
                 build_args += ["--config", cfg]
@@ -128,24 +199,89 @@ class CMakeBuild(build_ext):
         if "CMAKE_BUILD_PARALLEL_LEVEL" not in os.environ:
             # self.parallel is a Python 3 only way to set parallel jobs by hand
             # using -j in the build_ext call, not supported by pip or PyPA-build.
-            if hasattr(self, "parallel") and self.parallel:
-                # CMake 3.12+ only.
-                build_args += [f"-j{self.parallel}"]
+            # Otherwise, MAX_JOBS is respected or the number
+            # of available cores is used.
+            jobs = (getattr(self, "parallel", None)
+                    or os.environ.get("MAX_JOBS")
+                    or _get_cpu_count())
+            # CMake 3.12+ only.
+            build_args += ["--parallel", str(jobs)]
 
         if not os.path.exists(self.build_temp):
             os.makedirs(self.build_temp)
 
-        # Following two calls build the Cmake vinum_cpp project
-        subprocess.check_call(
-            ["cmake", ext.cmake_sourcedir] + cmake_args, cwd=self.build_temp
-        )
+        # Following two calls build the Cmake vinum_cpp project.
+        # The configure step is skipped if the project is already configured
+        # with exactly the same arguments.
+        configure_cmd = ["cmake", ext.cmake_sourcedir] + cmake_args
+        configure_hash = hashlib.sha1(
+            "\0".join(configure_cmd).encode()
+        ).hexdigest()
+        configure_proc = None
+        if not self._is_cmake_configured(configure_hash):
+            configure_proc = subprocess.Popen(
+                configure_cmd, cwd=self.build_temp, env=build_env
+            )
+
+        # Symlinks to pyarrow shared libs are only needed to link the
+        # python wrapper, so create them while CMake is configuring.
+        try:
+            pa.create_library_symlinks()
+        except BaseException:
+            # Don't leave the configure step running in the background.
+            if configure_proc:
+                configure_proc.kill()
+                configure_proc.wait()
+            raise
+
+        if configure_proc:
+            return_code = configure_proc.wait()
+            if return_code:
+                raise subprocess.CalledProcessError(return_code,
+                                                    configure_cmd)
+            self._save_cmake_configure_hash(configure_hash)
+        # Full rebuild is only done on request, by default
+        # the build is incremental.
+        clean_args = (["--clean-first"]
+                      if _env_flag("VINUM_CLEAN_BUILD")
+                      else [])
         subprocess.check_call(
-            ["cmake", "--build", ".", "--clean-first"] + build_args, cwd=self.build_temp
+            ["cmake", "--build", "."] + clean_args + build_args,
+            cwd=self.build_temp, env=build_env
         )
 
         # This call builds the python wrapper around vinum_cpp library
         super().build_extension(ext)
 
+    def _cmake_configure_hash_path(self):
+        return os.path.join(self.build_temp, self.CMAKE_CONFIGURE_HASH_FILE)
+
+    def _is_cmake_configured(self, configure_hash):
+        """
+        Returns True if CMake cache exists in the build directory and it was
+        generated with the arguments matching `configure_hash`.
+        """
+        if not os.path.exists(os.path.join(self.build_temp, "CMakeCache.txt")):
+            return False
+        try:
+            with open(self._cmake_configure_hash_path(), "r") as f:
+                return f.read().strip() == configure_hash
+        except OSError:
+            return False
+
+    def _save_cmake_configure_hash(self, configure_hash):
+        with open(self._cmake_configure_hash_path(), "w") as f:
+            f.write(configure_hash)
+
+
+def _get_cpu_count():
+    """
+    Returns the number of CPUs available to the current process.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
 
 def _get_distutils_build_directory():
     """
@@ -166,7 +302,7 @@ def create_extensions():
     cpp_lib_cxx_flags = ['-fPIC']
     python_lib_cxx_flags = []
     include_dirs = [
-        pa.get_include(),
+        ARROW_INCLUDE_DIR,
         'vinum_cpp/src/operators/aggregate',
         'vinum_cpp/src/operators/sort',
         'vinum_cpp/src/operators',
@@ -175,14 +311,21 @@ def create_extensions():
     library_dirs = [
         _get_distutils_build_directory()
     ]
-    library_dirs.extend(pa.get_library_dirs())
+    library_dirs.extend(ARROW_LIBRARY_DIRS)
 
-    libraries = [
-        VINUM_CPP_LIB_NAME, 'arrow', 'arrow_python'
-    ]
+    libraries = [VINUM_CPP_LIB_NAME]
+    libraries.extend(ARROW_LIBRARIES)
     python_lib_linker_args = []
     python_lib_macros = None
 
+    if is_native_build and sys.platform in ('darwin', 'linux'):
+        cpp_lib_cxx_flags.extend([
+            '-O3',
+            '-march=native',
+            '-ffunction-sections',
+            '-fdata-sections',
+        ])
+
     if sys.platform == 'darwin':
         python_lib_cxx_flags.append('--std=c++17')
         python_lib_cxx_flags.append('--stdlib=libc++')
@@ -235,6 +378,7 @@ setup(
     packages=find_packages(),
     python_requires=">=3.7",
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Environment :: Console",
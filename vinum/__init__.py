@@ -1,43 +1,72 @@
 # flake8: noqa
+import importlib
+import importlib.util
+import os
+from typing import TYPE_CHECKING
+
+from vinum._version import __version__
+
+if TYPE_CHECKING:
+    from vinum.core.udf import register_python, register_numpy
+    from vinum.io.arrow import stream_csv, read_csv, read_json, read_parquet
+    from vinum.api.table import Table
+    from vinum.api.stream_reader import StreamReader
+
+# Public API is imported lazily, on the first access,
+# so that `import vinum` does not load pyarrow and the C++ extension.
+_lazy_imports = {
+    'register_python': 'vinum.core.udf',
+    'register_numpy': 'vinum.core.udf',
+    'stream_csv': 'vinum.io.arrow',
+    'read_csv': 'vinum.io.arrow',
+    'read_json': 'vinum.io.arrow',
+    'read_parquet': 'vinum.io.arrow',
+    'Table': 'vinum.api.table',
+    'StreamReader': 'vinum.api.stream_reader',
+}
+
+__all__ = [*_lazy_imports, 'get_batch_size', 'set_batch_size', '__version__']
+
+_dependencies_checked = False
+
 
-hard_dependencies = ("pyarrow", "numpy", "pglast")
-missing_dependencies = []
+def _ensure_dependencies():
+    global _dependencies_checked
+    if _dependencies_checked:
+        return
 
-for dependency in hard_dependencies:
-    try:
-        __import__(dependency)
-    except ImportError as e:
-        missing_dependencies.append(f"{dependency}: {e}")
+    hard_dependencies = ("pyarrow", "numpy", "pglast")
+    missing_dependencies = []
 
-if missing_dependencies:
-    raise ImportError(
-        "Unable to import required dependencies:\n" + "\n".join(
-            missing_dependencies
+    # find_spec locates the packages without executing them
+    for dependency in hard_dependencies:
+        if importlib.util.find_spec(dependency) is None:
+            missing_dependencies.append(
+                f"{dependency}: No module named '{dependency}'"
+            )
+
+    if missing_dependencies:
+        raise ImportError(
+            "Unable to import required dependencies:\n" + "\n".join(
+                missing_dependencies
+            )
         )
-    )
-del hard_dependencies, dependency, missing_dependencies
+    _dependencies_checked = True
 
-import os
-import vinum_lib
-if os.environ.get('READTHEDOCS') != 'True' and vinum_lib.import_pyarrow() != 0:
-    raise RuntimeError('Failed to initialize pyarrow C++ bindings.')
 
-from vinum.core.udf import (   # noqa: F401
-    register_python,
-    register_numpy,
-)
+def __getattr__(name):
+    if name not in _lazy_imports:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
-from vinum.io.arrow import (  # noqa: F401
-    stream_csv,
-    read_csv,
-    read_json,
-    read_parquet,
-)
+    _ensure_dependencies()
+    attr = getattr(importlib.import_module(_lazy_imports[name]), name)
+    globals()[name] = attr
+    return attr
 
-from vinum.api.table import Table  # noqa: F401
-from vinum.api.stream_reader import StreamReader  # noqa: F401
 
-from vinum._version import __version__
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
+
 
 __doc__ = """
 **Vinum** is a SQL processor written for Python, designed for
@@ -49,7 +78,16 @@ the SQL language. Key features include native support of
 vectorized Numpy and Python functions as UDFs in SQL queries.
 """
 
-_batch_size = 10000
+def _validate_batch_size(batch_size) -> int:
+    batch_size = int(batch_size)
+    if batch_size <= 0:
+        raise ValueError(
+            f'Batch size has to be a positive integer, got: {batch_size}.'
+        )
+    return batch_size
+
+
+_batch_size = _validate_batch_size(os.environ.get('VINUM_BATCH_SIZE', 10000))
 
 
 def get_batch_size():
@@ -59,5 +97,5 @@ def get_batch_size():
 
 def set_batch_size(batch_size: int):
     global _batch_size
-    _batch_size = batch_size
+    _batch_size = _validate_batch_size(batch_size)
 
@@ -0,0 +1,6 @@
+import os
+
+import vinum_lib
+
+if os.environ.get('READTHEDOCS') != 'True' and vinum_lib.import_pyarrow() != 0:
+    raise RuntimeError('Failed to initialize pyarrow C++ bindings.')
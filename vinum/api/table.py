@@ -413,6 +413,9 @@ class Table:
         """
         Return first n rows of a table as Pandas DataFrame
 
+        Columns are converted into separate Pandas blocks, rather than
+        consolidated into 2D blocks by type, which avoids copying them.
+
         Parameters
         ----------
         n : int
@@ -423,7 +426,7 @@ class Table:
         :class:`pandas.DataFrame`
         """
         assert n >= 0
-        return self._arrow_table.slice(n).get_table().to_pandas()
+        return self._arrow_table.slice(n).to_pandas(split_blocks=True)
 
     @property
     def schema(self):
@@ -1,11 +1,12 @@
-from typing import List, Iterable, TYPE_CHECKING
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Iterable, Optional, TYPE_CHECKING
 
 import numpy as np
 
 import pyarrow as pa
-from pyarrow.lib import ChunkedArray, ArrowInvalid
 
-from vinum._typing import PyArrowArray
+from vinum.util.util import arrow_to_numpy
 
 if TYPE_CHECKING:
     try:
@@ -14,6 +15,17 @@ if TYPE_CHECKING:
         pass
 
 
+@lru_cache(maxsize=None)
+def _empty_array(data_type: pa.DataType) -> pa.Array:
+    """
+    Return an empty Arrow Array of a given type.
+
+    Arrays are immutable, hence the same instance is shared by all
+    the empty columns of the same type.
+    """
+    return pa.array([], type=data_type)
+
+
 class ArrowTable:
     """
     Apache Arrow Table abstraction.
@@ -30,11 +42,24 @@ class ArrowTable:
     ----------
     table : pyarrow.Table
         Apache Arrow Table instance.
+    _names_clean : bool
+        Internal. Column names are known to be non-empty,
+        hence the check can be skipped.
     """
-    def __init__(self, table: pa.Table) -> None:
-        assert table is not None
+    __slots__ = (
+        '_table',
+        '_column_names',
+        '_column_indexes',
+        '_np_columns',
+    )
+
+    def __init__(self, table: pa.Table, _names_clean: bool = False) -> None:
         self._table: pa.Table = table
-        self._ensure_non_empty_col_names()
+        self._column_names: Optional[List[str]] = None
+        if not _names_clean:
+            self._ensure_non_empty_col_names()
+        self._column_indexes: Dict[str, int] = self._build_column_indexes()
+        self._np_columns: Dict[int, np.ndarray] = {}
 
     def get_table(self) -> pa.Table:
         return self._table
@@ -52,89 +77,153 @@ class ArrowTable:
 
     @property
     def column_names(self) -> List[str]:
-        return self._table.column_names
+        # Schema builds a new list on every call.
+        if self._column_names is None:
+            self._column_names = self._table.column_names
+        return self._column_names
 
     def has_column(self, column_name: str) -> bool:
-        return column_name in self._table.schema.names
+        return column_name in self._column_indexes
 
     def combine_chunks(self) -> 'ArrowTable':
-        return ArrowTable(
-            self._table.combine_chunks()
+        return self._from_same_schema(
+            self._table.combine_chunks(),
+            self._column_indexes
         )
 
     def get_column_index(self, column_name: str) -> int:
-        return self._table.schema.names.index(column_name)
+        return self._column_indexes[column_name]
 
     def get_pa_column_by_index(self, index: int) -> pa.Array:
-        chunked = self._table.columns[index]
-
-        assert chunked.num_chunks <= 1
+        chunked = self._table.column(index)
 
-        return chunked.chunk(0) if chunked.num_chunks else pa.array([])
+        if chunked.num_chunks == 1:
+            return chunked.chunk(0)
+        elif chunked.num_chunks == 0:
+            return _empty_array(chunked.type)
+        else:
+            return pa.concat_arrays(chunked.chunks)
 
     def get_pa_column_by_name(self, column_name: str) -> pa.Array:
-        if column_name not in self._table.schema.names:
+        index = self._column_indexes.get(column_name)
+        if index is None:
             raise ValueError(f'Column "{column_name}" is not found.')
-        return self.get_pa_column_by_index(
-            self.get_column_index(column_name)
-        )
+        return self.get_pa_column_by_index(index)
 
     def get_np_column_by_name(self, column_name: str) -> np.ndarray:
-        arr = self.get_pa_column_by_name(column_name)
-        return self._arrow_array_to_numpy(arr)
+        """
+        Return column as Numpy array.
+
+        Conversion is done once per column, subsequent calls return
+        the same read-only array.
+        """
+        index = self._column_indexes.get(column_name)
+        if index is None:
+            raise ValueError(f'Column "{column_name}" is not found.')
+
+        np_arr = self._np_columns.get(index)
+        if np_arr is None:
+            chunked = self._table.column(index)
+            # Multi-chunk columns are converted directly, which avoids
+            # concatenating them into a single Arrow array first.
+            np_arr = arrow_to_numpy(
+                chunked if chunked.num_chunks > 1
+                else self.get_pa_column_by_index(index)
+            )
+            np_arr.flags.writeable = False
+            self._np_columns[index] = np_arr
+        return np_arr
 
     def slice(self, length: int, offset: int = 0) -> 'ArrowTable':
-        return ArrowTable(
-            self._table.slice(offset, length)
+        return self._from_same_schema(
+            self._table.slice(offset, length),
+            self._column_indexes
         )
 
     def rename_columns(self, column_names: List[str]) -> None:
         self._table = self._table.rename_columns(column_names)
+        self._column_names = None
+        self._column_indexes = self._build_column_indexes()
+
+    def to_pandas(self, split_blocks: bool = False) -> 'pd.DataFrame':
+        """
+        Convert to Pandas DataFrame.
+
+        Parameters
+        ----------
+        split_blocks : bool
+            Create a block per column, rather than consolidating columns
+            of the same type into a single 2D block, which copies them
+            all at once.
+        """
+        return self._table.to_pandas(split_blocks=split_blocks)
 
-    def to_pandas(self) -> 'pd.DataFrame':
-        return self._table.to_pandas()
+    @classmethod
+    def _from_same_schema(cls,
+                          table: pa.Table,
+                          column_indexes: Dict[str, int]) -> 'ArrowTable':
+        """
+        Create ArrowTable with the schema of an existing ArrowTable.
+
+        Column names are already validated and the name to index mapping
+        is reused, as it is never modified in place.
+        """
+        arrow_table = cls.__new__(cls)
+        arrow_table._table = table
+        arrow_table._column_names = None
+        arrow_table._column_indexes = column_indexes
+        arrow_table._np_columns = {}
+        return arrow_table
+
+    def _build_column_indexes(self) -> Dict[str, int]:
+        """
+        Map column names to column indexes.
+
+        In case of duplicate names, the index of the first column is used.
+        """
+        column_indexes: Dict[str, int] = {}
+        for index, col_name in enumerate(self.column_names):
+            column_indexes.setdefault(col_name, index)
+        return column_indexes
 
     def _ensure_non_empty_col_names(self):
+        column_names = self.column_names
+        if all(column_names):
+            return
+
         unnamed_count = 0
         new_names = []
-        for col_name in self.column_names:
+        for col_name in column_names:
             if not col_name:
                 new_names.append(f'unnamed_{unnamed_count}')
                 unnamed_count += 1
             else:
                 new_names.append(col_name)
-        if unnamed_count:
-            self.rename_columns(new_names)
+        self.rename_columns(new_names)
 
     @staticmethod
-    def _arrow_array_to_numpy(array: PyArrowArray) -> np.ndarray:
+    def from_batches(batches: Iterable[pa.RecordBatch],
+                     schema: Optional[pa.Schema] = None) -> 'ArrowTable':
         """
-        Convert Arrow Array or ChunkedArray to Numpy array.
+        Create ArrowTable from a sequence or an iterator of RecordBatches.
 
-        Returns
-        -------
-        :class:`numpy.ndarray`
-        """
-        # The implementation below would make a copy of an array
-        # for non-numeric types or columns with Nulls.
-        # TODO: is there a work-around to avoid making a copy?
-        if isinstance(array, ChunkedArray):
-            np_arr = array.to_numpy()
-        else:
-            try:
-                np_arr = array.to_numpy(zero_copy_only=True)
-            except ArrowInvalid:
-                np_arr = array.to_numpy(zero_copy_only=False)
-
-        # This type test is needed because by default, Arrow creates
-        # an 'object' typed numpy array for a 'string' column.
-        if array.type == 'string' and array.null_count == 0:
-            np_arr = np_arr.astype('U')
-
-        return np_arr
+        Batches are not copied, each batch becomes a chunk of the table.
 
-    @staticmethod
-    def from_batches(batches: Iterable[pa.RecordBatch]):
-        if not batches:
-            return ArrowTable(pa.Table.from_arrays([], []))
-        return ArrowTable(pa.Table.from_batches(batches))
\ No newline at end of file
+        Parameters
+        ----------
+        batches : Iterable[pa.RecordBatch]
+            RecordBatches.
+        schema : Optional[pa.Schema]
+            Schema of the table, used in case there are no batches.
+            Otherwise schema of the first batch is used.
+        """
+        batches = iter(batches)
+        first_batch = next(batches, None)
+        if first_batch is None:
+            if schema is None:
+                return ArrowTable(pa.Table.from_arrays([], []))
+            return ArrowTable(schema.empty_table())
+        return ArrowTable(
+            pa.Table.from_batches(chain((first_batch,), batches),
+                                  schema=first_batch.schema)
+        )
\ No newline at end of file
@@ -1,13 +1,15 @@
-from typing import List, Iterable, Tuple
+from typing import Dict, List, Iterable, Optional
 
 import numpy as np
 
 import pyarrow as pa
-from pyarrow.lib import ChunkedArray, ArrowInvalid
 
-from vinum._typing import PyArrowArray
 from vinum.parser.query import Column
-from vinum.util.util import is_numpy_array
+from vinum.util.util import (
+    arrow_to_numpy,
+    is_numpy_array,
+    numpy_to_arrow_mask,
+)
 
 
 class RecordBatch:
@@ -18,11 +20,22 @@ class RecordBatch:
     ----------
     table : pyarrow.RecordBatch
         Apache Arrow RecordBatch instance.
+    _names_clean : bool
+        Internal. Column names are known to be non-empty,
+        hence the check can be skipped.
     """
-    def __init__(self, batch: pa.RecordBatch) -> None:
-        assert batch is not None
+    # RecordBatch wrappers are created for every batch by every operator.
+    __slots__ = ('_batch', '_np_columns', '_ucs4_columns', '_column_names')
+
+    def __init__(self,
+                 batch: pa.RecordBatch,
+                 _names_clean: bool = False) -> None:
         self._batch: pa.RecordBatch = batch
-        self._ensure_non_empty_col_names()
+        self._column_names: Optional[List[str]] = None
+        if not _names_clean:
+            self._ensure_non_empty_col_names()
+        self._np_columns: Dict[int, np.ndarray] = {}
+        self._ucs4_columns: Dict[int, np.ndarray] = {}
 
     def get_batch(self) -> pa.RecordBatch:
         return self._batch
@@ -44,7 +57,10 @@ class RecordBatch:
 
     @property
     def column_names(self) -> List[str]:
-        return self._batch.schema.names
+        # Schema builds a new list on every call.
+        if self._column_names is None:
+            self._column_names = self._batch.schema.names
+        return self._column_names
 
     @staticmethod
     def from_arrays(arrays: Iterable[Iterable],
@@ -56,87 +72,122 @@ class RecordBatch:
     @staticmethod
     def empty_batch() -> 'RecordBatch':
         return RecordBatch(
-            pa.RecordBatch.from_arrays([], [])
+            pa.RecordBatch.from_arrays([], []),
+            _names_clean=True
         )
 
     def has_column(self, column_name: str) -> bool:
-        return column_name in self._batch.schema.names
+        return self._find_column_index(column_name) >= 0
 
     def get_column_index(self, column_name: str) -> int:
-        return self._batch.schema.names.index(column_name)
+        index = self._find_column_index(column_name)
+        if index < 0:
+            raise ValueError(f'Column "{column_name}" is not found.')
+        return index
+
+    def _find_column_index(self, column_name: str) -> int:
+        """
+        Return index of the first column with a given name or -1.
+        """
+        schema = self._batch.schema
+        index = schema.get_field_index(column_name)
+        if index < 0:
+            # Either there is no such column or the name is not unique.
+            indices = schema.get_all_field_indices(column_name)
+            if indices:
+                index = indices[0]
+        return index
 
     def get_pa_column(self, column: Column) -> pa.Array:
         return self.get_pa_column_by_name(column.get_column_name())
 
     def get_pa_column_by_index(self, index: int) -> pa.Array:
-        return self._batch.columns[index]
+        return self._batch.column(index)
 
     def get_pa_column_by_name(self, column_name: str) -> pa.Array:
-        if column_name not in self._batch.schema.names:
-            raise ValueError(f'Column "{column_name}" is not found.')
         return self.get_pa_column_by_index(
             self.get_column_index(column_name)
         )
 
     def get_np_column(self, column: Column) -> np.ndarray:
-        arr = self.get_pa_column(column)
-        return self._arrow_array_to_numpy(arr)
+        """
+        Return column as Numpy array.
+
+        The same column is often used by several expressions, hence
+        conversion is done once per column and subsequent calls return
+        the same read-only array.
+        """
+        index = self.get_column_index(column.get_column_name())
+
+        np_arr = self._np_columns.get(index)
+        if np_arr is None:
+            np_arr = arrow_to_numpy(
+                self.get_pa_column_by_index(index)
+            )
+            np_arr.flags.writeable = False
+            self._np_columns[index] = np_arr
+        return np_arr
+
+    def get_np_column_as_ucs4(self, column: Column) -> np.ndarray:
+        """
+        Return string column as Numpy array of the fixed width
+        unicode dtype.
+
+        Unlike 'object' typed arrays returned by `get_np_column`,
+        such arrays are accepted by ``np.char`` functions. String columns
+        with Nulls and columns of other types are returned as by
+        `get_np_column`. The conversion is done once per column.
+        """
+        index = self.get_column_index(column.get_column_name())
+        pa_arr = self.get_pa_column_by_index(index)
+        if not pa.types.is_string(pa_arr.type) or pa_arr.null_count:
+            return self.get_np_column(column)
+
+        np_arr = self._ucs4_columns.get(index)
+        if np_arr is None:
+            np_arr = arrow_to_numpy(pa_arr, force_unicode_dtype=True)
+            np_arr.flags.writeable = False
+            self._ucs4_columns[index] = np_arr
+        return np_arr
 
     def filter(self, bitmask: Iterable[bool]) -> 'RecordBatch':
+        # Masks produced by Arrow kernels are used as is.
         if is_numpy_array(bitmask):
-            bitmask = pa.array(bitmask)
+            if (bitmask.dtype == np.bool_
+                    and len(bitmask) == self.num_rows):
+                # Avoid copying the batch if all or none of the rows match.
+                num_selected = np.count_nonzero(bitmask)
+                if num_selected == self.num_rows:
+                    return self
+                elif num_selected == 0:
+                    return self.slice(0)
+            bitmask = numpy_to_arrow_mask(bitmask)
         return RecordBatch(
-            self._batch.filter(bitmask, null_selection_behavior='emit_null')
+            self._batch.filter(bitmask, null_selection_behavior='emit_null'),
+            _names_clean=True
         )
 
     def slice(self, length: int, offset: int = 0) -> 'RecordBatch':
         return RecordBatch(
-            self._batch.slice(offset, length)
+            self._batch.slice(offset, length),
+            _names_clean=True
         )
 
     def rename_columns(self, column_names: List[str]) -> None:
         self._batch = self._batch.rename_columns(column_names)
-
-    @staticmethod
-    def _arrow_array_to_numpy(array: PyArrowArray) -> np.ndarray:
-        """
-        Convert Arrow Array or ChunkedArray to Numpy array.
-
-        Returns
-        -------
-        :class:`numpy.ndarray`
-        """
-        # The implementation below would make a copy of an array
-        # for non-numeric types or columns with Nulls.
-        # TODO: is there a work-around to avoid making a copy?
-        if isinstance(array, ChunkedArray):
-            np_arr = array.to_numpy()
-        else:
-            try:
-                np_arr = array.to_numpy(zero_copy_only=True)
-            except ArrowInvalid:
-                np_arr = array.to_numpy(zero_copy_only=False)
-
-        # This type test is needed because by default, Arrow creates
-        # an 'object' typed numpy array for a 'string' column.
-        if array.type == 'string' and array.null_count == 0:
-            np_arr = np_arr.astype('U')
-
-        return np_arr
-
-    def _new_record_batch(self,
-                   columns: Tuple[Iterable],
-                   column_names: Tuple[str, ...]) -> None:
-        self._batch = pa.RecordBatch.from_arrays(columns, names=column_names)
+        self._column_names = None
 
     def _ensure_non_empty_col_names(self):
+        column_names = self.column_names
+        if all(column_names):
+            return
+
         unnamed_count = 0
         new_names = []
-        for col_name in self.column_names:
+        for col_name in column_names:
             if not col_name:
                 new_names.append(f'unnamed_{unnamed_count}')
                 unnamed_count += 1
             else:
                 new_names.append(col_name)
-        if unnamed_count:
-            self.rename_columns(new_names)
+        self.rename_columns(new_names)
@@ -1,14 +1,26 @@
+from itertools import chain
+
 import pyarrow as pa
 
 from typing import Iterable
 
-import vinum_lib
+from vinum._lib import vinum_lib
 
 from vinum.arrow.record_batch import RecordBatch
 from vinum.core.base import Operator, VectorizedExpression
 from vinum.parser.query import Column
 
 
+AGG_FUNC_TYPES = {
+    'COUNT': vinum_lib.AggFuncType.COUNT,
+    'COUNT_STAR': vinum_lib.AggFuncType.COUNT_STAR,
+    'MIN': vinum_lib.AggFuncType.MIN,
+    'MAX': vinum_lib.AggFuncType.MAX,
+    'SUM': vinum_lib.AggFuncType.SUM,
+    'AVG': vinum_lib.AggFuncType.AVG,
+}
+
+
 class AggregateFunction(VectorizedExpression):
     """
     Abstract Base Class for all aggregate functions.
@@ -20,13 +32,17 @@ class AggregateFunction(VectorizedExpression):
         else:
             self._input_column_name = column.get_column_name()
         assert func
-        self._func = func
+        self._func = func.upper()
+        self._agg_func_type = AGG_FUNC_TYPES[self._func]
 
     def get_input_column_name(self) -> str:
         return self._input_column_name
 
     def get_agg_func_name(self):
-        return self._func.upper()
+        return self._func
+
+    def get_agg_func_type(self) -> 'vinum_lib.AggFuncType':
+        return self._agg_func_type
 
 
 class AggregateOperator(Operator):
@@ -37,15 +53,6 @@ class AggregateOperator(Operator):
     physical operators.
     """
 
-    FUNCS = {
-        'COUNT': vinum_lib.AggFuncType.COUNT,
-        'COUNT_STAR': vinum_lib.AggFuncType.COUNT_STAR,
-        'MIN': vinum_lib.AggFuncType.MIN,
-        'MAX': vinum_lib.AggFuncType.MAX,
-        'SUM': vinum_lib.AggFuncType.SUM,
-        'AVG': vinum_lib.AggFuncType.AVG,
-    }
-
     def __init__(self,
                  parent_operator: 'Operator',
                  group_by_columns: Iterable[Column],
@@ -68,30 +75,28 @@ class AggregateOperator(Operator):
     def _init_agg_obj(self, batch):
         schema = batch.get_schema()
 
-        only_numer_groupby = True
-        groupby_col_names = []
-
-        for c in self._group_by_columns:
-            col_name = c.get_column_name()
-            groupby_col_names.append(col_name)
-            if not self._is_numeric_type(schema.field(col_name).type):
-                only_numer_groupby = False
+        groupby_col_names = [
+            c.get_column_name()
+            for c in self._group_by_columns
+        ]
+        only_numer_groupby = all(
+            self._is_numeric_type(schema.field(col_name).type)
+            for col_name in groupby_col_names
+        )
 
         agg_col_names = [
             c.get_column_name()
             for c in self._agg_cols
         ]
 
-        agg_funcs = []
-        for func in self._agg_funcs:
-            col_name = func.get_input_column_name()
-            out_col_name = func.get_column_name()
-            func_def = vinum_lib.AggFuncDef(
-                self.FUNCS[func.get_agg_func_name()],
-                col_name,
-                out_col_name
+        agg_funcs = [
+            vinum_lib.AggFuncDef(
+                func.get_agg_func_type(),
+                func.get_input_column_name(),
+                func.get_column_name()
             )
-            agg_funcs.append(func_def)
+            for func in self._agg_funcs
+        ]
 
         if len(groupby_col_names) == 0:
             agg_obj = vinum_lib.OneGroupAggregate(agg_funcs)
@@ -112,13 +117,16 @@ class AggregateOperator(Operator):
         self.agg_obj = agg_obj
 
     def next(self) -> Iterable[RecordBatch]:
-        for batch in self._parent_operator.next():
-            if not self.agg_obj:
-                self._init_agg_obj(batch)
-
-            self.agg_obj.next(batch.get_batch())
-
-        if self.agg_obj:
-            yield RecordBatch(self.agg_obj.result())
+        batches = iter(self._parent_operator.next())
+        # Aggregate object depends on the types of the input columns,
+        # hence it is created once the first batch is available.
+        first_batch = next(batches, None)
+        if first_batch is not None:
+            self._init_agg_obj(first_batch)
+            agg_obj = self.agg_obj
+            for batch in chain((first_batch,), batches):
+                agg_obj.next(batch.get_batch())
+
+            yield RecordBatch(agg_obj.result())
 
         del self.agg_obj
@@ -1,3 +1,5 @@
+import queue
+import threading
 from itertools import chain
 
 from typing import (
@@ -11,7 +13,7 @@ import numpy as np
 
 import pyarrow as pa
 
-import vinum_lib
+from vinum._lib import vinum_lib
 
 from vinum._typing import AnyArrayLike, OperatorArgument
 from vinum.arrow.arrow_table import ArrowTable
@@ -47,11 +49,18 @@ class ProjectOperator(Operator):
                  keep_input_table=False) -> None:
         super().__init__(parent_operator, arguments)
         self._col_names = col_names
+        self._arg_col_names: Optional[Tuple[str, ...]] = None
         self._keep_input_table = keep_input_table
 
+    def next(self) -> Iterable[RecordBatch]:
+        # Column names are resolved before the batches are submitted
+        # to the worker threads, which only read them.
+        self._get_column_names()
+        yield from super().next()
+
     def _kernel(self, batch: RecordBatch, arguments: Tuple) -> RecordBatch:
-        arrays = self._repeat_scalars(arguments)
-        self._ensure_equal_arrays_size(arrays)
+        size = self._ensure_equal_arrays_size(arguments)
+        arrays = self._repeat_scalars(arguments, size)
 
         col_names = self._get_column_names()
 
@@ -67,42 +76,60 @@ class ProjectOperator(Operator):
         if self._col_names:
             return self._col_names
 
-        return tuple(
-            arg.get_column_name()
-            for arg
-            in self._arguments
-        )
+        # Resolved once the planner is done assigning the shared
+        # expressions IDs, and reused afterwards.
+        if self._arg_col_names is None:
+            self._arg_col_names = tuple(
+                arg.get_column_name()
+                for arg
+                in self._arguments
+            )
+        return self._arg_col_names
 
     @staticmethod
-    def _repeat_scalars(arguments: Iterable) -> Iterable:
-        arr_lens = list(len(arr) for arr in arguments if is_array_type(arr))
-        col_max_len = max(arr_lens) if arr_lens else 1
-
+    def _repeat_scalars(arguments: Iterable, size: int) -> Iterable:
         arrays = []
         for arg in arguments:
             if is_array_type(arg):
                 arrays.append(arg)
             else:
-                arrays.append(np.repeat(arg, col_max_len))
+                # Read-only view, the data is materialized only once,
+                # when the Arrow array is created.
+                arrays.append(np.broadcast_to(np.asarray(arg), (size,)))
         return tuple(arrays)
 
     @staticmethod
-    def _ensure_equal_arrays_size(arrays: Iterable[AnyArrayLike]) -> None:
-        size = None
-        size_index = None
-        for idx, array in enumerate(arrays):
-            if size is None:
-                size = len(array)
-                size_index = idx
-            else:
-                if len(array) != size:
-                    err_msg = (
-                        f'Select expressions have unequal sizes. '
-                        f'This is not permitted. '
-                        f'Expression one index: {size_index}, size: {size}. '
-                        f'Expression two index: {idx}, size: {len(array)}.'
-                    )
-                    raise OperatorError(err_msg)
+    def _ensure_equal_arrays_size(arguments: Iterable[Any]) -> int:
+        """
+        Ensure all the array arguments have the same size and return it.
+
+        If there are no arrays, scalars form a single row, hence 1 is
+        returned.
+        """
+        sizes = [
+            (idx, len(arg))
+            for idx, arg in enumerate(arguments)
+            if is_array_type(arg)
+        ]
+        if not sizes:
+            return 1
+
+        size_index, size = sizes[0]
+        lengths = [arr_size for _, arr_size in sizes]
+        if min(lengths) != max(lengths):
+            idx, arr_size = next(
+                (idx, arr_size)
+                for idx, arr_size in sizes
+                if arr_size != size
+            )
+            err_msg = (
+                f'Select expressions have unequal sizes. '
+                f'This is not permitted. '
+                f'Expression one index: {size_index}, size: {size}. '
+                f'Expression two index: {idx}, size: {arr_size}.'
+            )
+            raise OperatorError(err_msg)
+        return size
 
 
 class FilterOperator(Operator):
@@ -159,12 +186,14 @@ class SortOperator(Operator):
     def next(self) -> Iterable[RecordBatch]:
         for batch in self._parent_operator.next():
             self._process_arguments(self._arguments, batch=batch)
-            col_names = tuple(i[0] for i in self._expressions)
-            exprs = tuple(i[1] for i in self._expressions)
-            batch = RecordBatch.from_arrays(
-                tuple(chain(batch.columns, exprs)),
-                tuple(chain(batch.column_names, col_names))
-            )
+            # If sorting only by columns, the batch already has all the keys.
+            if self._expressions:
+                col_names = tuple(i[0] for i in self._expressions)
+                exprs = tuple(i[1] for i in self._expressions)
+                batch = RecordBatch.from_arrays(
+                    tuple(chain(batch.columns, exprs)),
+                    tuple(chain(batch.column_names, col_names))
+                )
 
             # Remove, once sorting by boolean columns is supported by Arrow
             self._verify_bool_columns(batch.get_schema())
@@ -213,23 +242,39 @@ class SliceOperator(Operator):
         Number of rows to retain.
     offset : int
         Offset where to start the slice.
+    reader_operator : Optional[BaseReaderOperator]
+        Reader operator to push the limit and offset down to.
+        Should only be provided if operators in between preserve rows.
     """
     def __init__(self,
                  limit: int,
                  offset: int,
-                 parent_operator: Operator) -> None:
+                 parent_operator: Operator,
+                 reader_operator: Optional['BaseReaderOperator'] = None,
+                 ) -> None:
         super().__init__(parent_operator)
 
         self._limit = limit
         self._offset = offset
 
+        self._reader_operator = reader_operator
+        if reader_operator is not None:
+            reader_operator.pushdown_limit_offset(limit, offset)
+
         self._num_returned = 0
         self._curr_offset = 0
 
     def next(self) -> ArrowTable:
+        # The plan may be executed more than once.
+        self._num_returned = 0
+        self._curr_offset = 0
         for batch in self._parent_operator.next():
             if self._num_returned >= self._limit:
                 break
+            if self._reader_operator is not None:
+                # Batches skipped by the reader are not passed through.
+                self._curr_offset = max(self._curr_offset,
+                                        self._reader_operator.num_skipped_rows)
             if self._offset >= self._curr_offset + batch.num_rows:
                 self._curr_offset += batch.num_rows
                 continue
@@ -247,17 +292,79 @@ class SliceOperator(Operator):
             self._curr_offset += offset + slice_size
 
 
-class TableReaderOperator(Operator):
+class BaseReaderOperator(Operator):
+    """
+    Base Reader Operator.
+
+    Source of the batches of a query plan.
+    If the rest of the plan preserves rows, ie there are no filters,
+    aggregates or sorting, LIMIT and OFFSET can be pushed down to the
+    reader, see :meth:`pushdown_limit_offset`.
+    """
+    def __init__(self) -> None:
+        super().__init__(None)
+        self._limit: Optional[int] = None
+        self._offset: int = 0
+        self.num_skipped_rows: int = 0
+
+    def pushdown_limit_offset(self,
+                              limit: Optional[int],
+                              offset: Optional[int]) -> None:
+        """
+        Skip batches which are entirely before the `offset` and stop
+        reading once `offset + limit` rows are read.
+
+        Batches are returned unchanged, trimming them is still done
+        by the SliceOperator, which accounts for `num_skipped_rows`.
+        If `limit` is None, only the batches before the `offset`
+        are skipped.
+        """
+        self._limit = limit
+        self._offset = offset or 0
+
+    def next(self) -> RecordBatch:
+        # The plan may be executed more than once.
+        self.num_skipped_rows = 0
+        if self._limit is None and not self._offset:
+            yield from self._read()
+            return
+
+        end_row = (
+            None if self._limit is None else self._offset + self._limit
+        )
+        if end_row == 0:
+            return
+
+        num_rows = 0
+        for batch in self._read():
+            if self._offset and num_rows + batch.num_rows <= self._offset:
+                num_rows += batch.num_rows
+                self.num_skipped_rows = num_rows
+                continue
+            num_rows += batch.num_rows
+            yield batch
+            # Stop before the next batch is read.
+            if end_row is not None and num_rows >= end_row:
+                break
+
+    def _read(self) -> Iterable[RecordBatch]:
+        """
+        Read the batches.
+        """
+        raise NotImplementedError
+
+
+class TableReaderOperator(BaseReaderOperator):
     def __init__(self,
                  table: ArrowTable) -> None:
-        super().__init__(None)
+        super().__init__()
         self._reader: vinum_lib.TableBatchReader = vinum_lib.TableBatchReader(
             table.get_table())
 
         from vinum import get_batch_size
         self._reader.set_batch_size(get_batch_size())
 
-    def next(self) -> RecordBatch:
+    def _read(self) -> Iterable[RecordBatch]:
         while True:
             batch = self._reader.next()
             if batch is None:
@@ -265,18 +372,81 @@ class TableReaderOperator(Operator):
             yield RecordBatch(batch)
 
 
-class FileReaderOperator(Operator):
+class FileReaderOperator(BaseReaderOperator):
+    """
+    File Reader Operator.
+
+    Batches are read from the stream in a background thread, up to
+    `PREFETCH_BATCHES` ahead of the pipeline, so that reading and parsing
+    of the input overlaps with the processing of the previous batches.
+
+    The size of the stream batches is defined by the reader's block size,
+    larger batches are sliced into the batches of the configured
+    batch size, same as for the in-memory tables.
+    """
+    PREFETCH_BATCHES = 2
+
     def __init__(self, reader: pa.csv.CSVStreamingReader) -> None:
-        super().__init__(None)
+        super().__init__()
         self._reader: reader = reader
 
-    def next(self) -> RecordBatch:
-        while True:
-            try:
-                batch = self._reader.read_next_batch()
-            except StopIteration:
-                break
+        from vinum import get_batch_size
+        self._batch_size: int = get_batch_size()
+
+    def _read(self) -> Iterable[RecordBatch]:
+        batches: queue.Queue = queue.Queue(maxsize=self.PREFETCH_BATCHES)
+        stop_reading = threading.Event()
+        reader_thread = threading.Thread(
+            target=self._read_batches,
+            args=(batches, stop_reading),
+            daemon=True
+        )
+        reader_thread.start()
+        try:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                elif isinstance(batch, Exception):
+                    raise batch
+                yield from self._split_batch(batch)
+        finally:
+            # The pipeline may stop early, ie once the LIMIT is reached.
+            stop_reading.set()
+            reader_thread.join()
+
+    def _split_batch(self, batch: pa.RecordBatch) -> Iterable[RecordBatch]:
+        if batch.num_rows <= self._batch_size:
             yield RecordBatch(batch)
+            return
+        for offset in range(0, batch.num_rows, self._batch_size):
+            yield RecordBatch(batch.slice(offset, self._batch_size))
+
+    def _read_batches(self,
+                      batches: queue.Queue,
+                      stop_reading: threading.Event) -> None:
+        try:
+            while not stop_reading.is_set():
+                try:
+                    batch = self._reader.read_next_batch()
+                except StopIteration:
+                    break
+                self._put_batch(batches, batch, stop_reading)
+        except Exception as e:
+            self._put_batch(batches, e, stop_reading)
+            return
+        self._put_batch(batches, None, stop_reading)
+
+    @staticmethod
+    def _put_batch(batches: queue.Queue,
+                   batch: Any,
+                   stop_reading: threading.Event) -> None:
+        while not stop_reading.is_set():
+            try:
+                batches.put(batch, timeout=0.1)
+                return
+            except queue.Full:
+                continue
 
 
 class EmptyTableReaderOperator(Operator):
@@ -289,7 +459,6 @@ class EmptyTableReaderOperator(Operator):
 
 class MaterializeTableOperator(Operator):
     def next(self) -> ArrowTable:
-        batches = []
-        for batch in self._parent_operator.next():
-            batches.append(batch.get_batch())
-        yield ArrowTable.from_batches(batches)
+        yield ArrowTable.from_batches(
+            batch.get_batch() for batch in self._parent_operator.next()
+        )
@@ -1,4 +1,3 @@
-import warnings
 from typing import (
     Any,
     Callable,
@@ -14,6 +13,7 @@ import numpy as np
 
 from vinum._typing import OperatorArgument
 from vinum.arrow.record_batch import RecordBatch
+from vinum.executor.thread_pool import ordered_parallel_map
 from vinum.parser.query import Literal, Column, HasColumnName
 from vinum.util.tree_print import RecursiveTreePrint
 
@@ -25,34 +25,81 @@ class BaseArgumentsProcessor:
     """
     Base args functionality.
     """
+    # Whether batches may be processed concurrently, in the worker threads.
+    # Expressions calling User Defined Functions opt out by default.
+    parallel_safe: bool = True
+
+    _arguments: Tuple[OperatorArgument, ...] = ()
+
     def __init__(self) -> None:
         super().__init__()
         self._shared_expressions = []
+        self._argument_getters: Tuple[Any, Tuple[Callable, ...]] = (
+            None, ()
+        )
 
     def _process_arguments(self,
                            arguments: Iterable[OperatorArgument],
                            batch: RecordBatch) -> Tuple:
         return tuple(
-            self._process_argument(arg, batch) for arg in arguments
+            getter(batch) for getter in self._get_argument_getters(arguments)
         )
 
-    def _process_argument(self,
-                          argument: OperatorArgument,
-                          batch: RecordBatch) -> Any:
+    def _get_argument_getters(self,
+                              arguments: Iterable[OperatorArgument]
+                              ) -> Tuple[Callable, ...]:
+        """
+        Return argument getters, functions resolving arguments for a batch.
+
+        The argument type dispatch is done once, rather than for every
+        batch. Getters are rebuilt if the arguments are replaced.
+
+        Batches may be processed concurrently, hence getters may be built
+        by several worker threads at once. This is harmless: getters only
+        depend on the arguments, every thread uses the getters it has
+        built itself, and the cache is replaced with a single assignment
+        of an `(arguments, getters)` pair.
+        """
+        cached_arguments, getters = self._argument_getters
+        if cached_arguments is not arguments:
+            getters = tuple(
+                self._new_argument_getter(arg) for arg in arguments
+            )
+            self._argument_getters = (arguments, getters)
+        return getters
+
+    def _new_argument_getter(self,
+                             argument: OperatorArgument
+                             ) -> Callable[[RecordBatch], Any]:
         if argument is None:
-            return
+            return lambda batch: None
 
         if isinstance(argument, Literal):
-            return self._unpack_literal(argument)
+            value = self._unpack_literal(argument)
+            return lambda batch: value
         elif isinstance(argument, Column):
-            return self._get_column(argument, batch)
+            get_column = self._get_column
+            return lambda batch: get_column(argument, batch)
         elif isinstance(argument, VectorizedExpression):
-            return self._eval_expression(argument, batch)
+            eval_expression = self._eval_expression
+            return lambda batch: eval_expression(argument, batch)
         else:
             raise TypeError(
                 f'Unsupported OperatorArgument type: {type(argument)}'
             )
 
+    def is_parallel_safe(self) -> bool:
+        """
+        Return True if batches may be processed concurrently.
+
+        Expression tree is parallel safe only if all its nodes are.
+        """
+        return self.parallel_safe and all(
+            arg.is_parallel_safe()
+            for arg in self._arguments
+            if isinstance(arg, VectorizedExpression)
+        )
+
     @staticmethod
     def _unpack_literal(value: Literal) -> Any:
         return value.value
@@ -91,14 +138,19 @@ class VectorizedExpression(BaseArgumentsProcessor,
                  function: Optional[Callable] = None,
                  is_numpy_func: bool = False,
                  is_binary_func: bool = False,
+                 parallel_safe: bool = True,
+                 force_unicode_dtype: bool = False,
                  ) -> None:
         super().__init__()
-        self._arguments: Tuple[OperatorArgument, ...] = tuple(arguments)
+        self._arguments = tuple(arguments)
+        if not parallel_safe:
+            self.parallel_safe = False
 
         self._function: Optional[Callable] = function
 
         self._is_numpy_function: bool = is_numpy_func
         self._is_binary_func: bool = is_binary_func
+        self._force_unicode_dtype: bool = force_unicode_dtype
 
         self._shared_id: Optional[str] = None
 
@@ -111,14 +163,11 @@ class VectorizedExpression(BaseArgumentsProcessor,
         """
         processed_args = self._process_arguments(self._arguments, batch)
         if self._function:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", category=RuntimeWarning)
-                if self._is_binary_func:
-                    result = self._apply_binary_args_function(
-                        *processed_args
-                    )
-                else:
-                    result = self._function(*processed_args)
+            # RuntimeWarnings of numpy functions are silenced by the Executor
+            if self._is_binary_func:
+                result = self._apply_binary_args_function(*processed_args)
+            else:
+                result = self._function(*processed_args)
         else:
             result = self._expr_kernel(processed_args, batch)
 
@@ -144,9 +193,26 @@ class VectorizedExpression(BaseArgumentsProcessor,
 
     def _apply_binary_args_function(self, *args: OperatorArgument) -> Any:
         assert self._function is not None
-        result = args[0]
-        for arg in args[1:]:
-            result = self._function(result, arg)
+        if len(args) < 2:
+            return args[0]
+
+        function = self._function
+        result = function(args[0], args[1])
+        # The intermediate result is owned by the expression, hence
+        # Numpy ufuncs may accumulate into it, instead of allocating
+        # a new array for each of the remaining arguments.
+        is_inplace_func = isinstance(function, np.ufunc)
+        for arg in args[2:]:
+            if (
+                    is_inplace_func
+                    and isinstance(result, np.ndarray)
+                    and result.ndim == 1
+                    and np.result_type(result, arg) == result.dtype
+                    and np.shape(arg) in ((), result.shape)
+            ):
+                function(result, arg, out=result)
+            else:
+                result = function(result, arg)
 
         return result
 
@@ -161,6 +227,8 @@ class VectorizedExpression(BaseArgumentsProcessor,
                     column: Column,
                     batch: RecordBatch) -> Union[np.ndarray, pa.Array]:
         if self._is_numpy_function:
+            if self._force_unicode_dtype:
+                return batch.get_np_column_as_ucs4(column)
             return batch.get_np_column(column)
         else:
             return batch.get_pa_column(column)
@@ -249,15 +317,28 @@ class Operator(BaseArgumentsProcessor, HasColumnName, RecursiveTreePrint):
 
         if arguments is None:
             arguments = []
-        self._arguments: Tuple[OperatorArgument, ...] = tuple(arguments)
+        self._arguments = tuple(arguments)
 
     def next(self) -> Iterable[RecordBatch]:
         """
         Execute Operator logic and yeild the result.
+
+        Batches are independent from each other, hence they are processed
+        in parallel, in the shared thread pool, unless the operator
+        or any of its expressions is not parallel safe.
+        Operators which need to keep a state across batches should
+        override this method.
         """
-        for batch in self._parent_operator.next():
-            args = self._process_arguments(self._arguments, batch=batch)
-            yield self._kernel(batch, args)
+        batches = self._parent_operator.next()
+        if self.is_parallel_safe():
+            yield from ordered_parallel_map(self._process_batch, batches)
+        else:
+            for batch in batches:
+                yield self._process_batch(batch)
+
+    def _process_batch(self, batch: RecordBatch) -> RecordBatch:
+        args = self._process_arguments(self._arguments, batch=batch)
+        return self._kernel(batch, args)
 
     def _kernel(self,
                 batch: RecordBatch,
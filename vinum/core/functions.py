@@ -1,11 +1,19 @@
+import operator
 import re
 from enum import Enum, auto
-from typing import Optional, Any, Iterable, Tuple, Union
+from functools import lru_cache
+from itertools import repeat
+from typing import Optional, Any, Callable, Iterable, Tuple, Union
 
 import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from vinum._typing import AnyArrayLike, OperatorArgument
 from vinum.arrow.arrow_table import ArrowTable
 from vinum.core.base import VectorizedExpression
@@ -13,6 +21,7 @@ from vinum.core.base import VectorizedExpression
 from vinum.errors import OperatorError
 from vinum.parser.query import Column, Literal
 from vinum.util.util import (
+    arrow_to_numpy,
     ensure_is_array,
     is_numpy_array,
     is_numpy_str_array,
@@ -51,16 +60,22 @@ class DatetimeFunction(VectorizedExpression):
         return unit
 
     @staticmethod
-    def _format_datetime_dtype(unit: str = None) -> str:
+    @lru_cache(maxsize=32)
+    def _datetime_dtype(unit: str = None) -> np.dtype:
+        """
+        Return datetime64 dtype of the unit.
+
+        Dtypes are cached, rather than parsed from a string for every batch.
+        """
         dtype = 'datetime64'
         if unit:
-            return f'{dtype}[{unit}]'
+            return np.dtype(f'{dtype}[{unit}]')
         else:
-            return dtype
+            return np.dtype(dtype)
 
     def _get_dtype(self, arguments: Any):
         unit = self._get_unit(arguments)
-        return self._format_datetime_dtype(unit)
+        return self._datetime_dtype(unit)
 
     @staticmethod
     def _parse_numpy_datetime_unit(dtype: np.dtype) -> str:
@@ -71,7 +86,9 @@ class DatetimeFunction(VectorizedExpression):
         else:
             return ''
 
-    def _find_higher_res_unit(self, numpy_unit: str) -> str:
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _find_higher_res_unit(cls, numpy_unit: str) -> str:
         """"
         Find the next supported unit which would give higher resolution,
         than provided numpy unit.
@@ -86,13 +103,13 @@ class DatetimeFunction(VectorizedExpression):
             Numpy datetime unit ('Y', 'M', 'W', 'D', 'h', ..)
         """
         try:
-            np_units_idx = self.NUMPY_UNITS.index(numpy_unit)
-            for sup_unit in self.NUMPY_UNITS[np_units_idx + 1:]:
-                if sup_unit in self.UNITS:
+            np_units_idx = cls.NUMPY_UNITS.index(numpy_unit)
+            for sup_unit in cls.NUMPY_UNITS[np_units_idx + 1:]:
+                if sup_unit in cls.UNITS:
                     return sup_unit
         except ValueError:
             pass
-        return self.UNITS[-1]
+        return cls.UNITS[-1]
 
     def _ensure_unit_correctness(self, np_array: np.ndarray) -> np.ndarray:
         """
@@ -106,7 +123,7 @@ class DatetimeFunction(VectorizedExpression):
         unit = self._parse_numpy_datetime_unit(np_array.dtype)
         if unit not in self.UNITS:
             sup_unit = self._find_higher_res_unit(unit)
-            return np_array.astype(self._format_datetime_dtype(sup_unit))
+            return np_array.astype(self._datetime_dtype(sup_unit))
         return np_array
 
     def _expr_kernel(self, arguments: Any, table: ArrowTable) -> Any:
@@ -115,7 +132,9 @@ class DatetimeFunction(VectorizedExpression):
             raise OperatorError(msg)
 
         arg = ensure_is_array(arguments[0])
-        dtimes = np.array(arg, dtype=self._get_dtype(arguments))
+        # Arrays which already have the target dtype are used as is,
+        # others are converted without an extra defensive copy.
+        dtimes = np.asarray(arg, dtype=self._get_dtype(arguments))
         return self._ensure_unit_correctness(dtimes)
 
 
@@ -162,7 +181,9 @@ class AbstractCastFunction(VectorizedExpression):
             arr = arguments[0]
 
         arr = ensure_is_array(arr)
-        return np.array(arr, dtype=self.type)
+        # Arrays which already have the target dtype are used as is,
+        # others are converted without an extra defensive copy.
+        return np.asarray(arr, dtype=self.type)
 
 
 class BoolCastFunction(AbstractCastFunction):
@@ -215,7 +236,11 @@ class AbstractStringFunction(VectorizedExpression):
 
         for arg in args:
             if is_numpy_array(arg):
-                clean_arg = np.array(arg, dtype="U")
+                # String columns are already fetched as fixed width
+                # unicode arrays, which are used as is. Only object
+                # arrays, such as columns with Nulls, or non-string
+                # arrays are cast.
+                clean_arg = np.asarray(arg, dtype="U")
             elif is_pyarrow_array(arg):
                 if not pa.types.is_string(arg.type):
                     clean_arg = arg.cast(target_type=pa.string())
@@ -265,7 +290,8 @@ class ConcatFunction(AbstractStringFunction):
         super().__init__(arguments=arguments,
                          function=np.char.add,
                          is_numpy_func=True,
-                         is_binary_func=True)
+                         is_binary_func=True,
+                         force_unicode_dtype=True)
 
     def _process_arguments(self, arguments: Iterable[OperatorArgument],
                            batch: ArrowTable) -> Tuple:
@@ -298,6 +324,83 @@ class LowerStringFunction(AbstractStringFunction):
         # return np.char.lower(*arguments)
 
 
+# String methods implementing LIKE patterns without `_` wildcards,
+# by the presence of `%` wildcards at the start and the end of the pattern.
+_LIKE_STRING_METHODS = {
+    (False, False): operator.eq,
+    (False, True): str.startswith,
+    (True, False): str.endswith,
+    (True, True): str.__contains__,
+}
+
+_REGEX_SPECIAL_CHARS = frozenset('.^$*+?{}[]\\|()')
+
+# Codes of the wildcards in the LIKE kernel patterns,
+# other pattern characters are stored as their ASCII codes.
+_LIKE_ANY_CHARS = -1
+_LIKE_SINGLE_CHAR = -2
+
+
+def _like_ascii_kernel(data: np.ndarray,
+                       offsets: np.ndarray,
+                       pattern: np.ndarray,
+                       out: np.ndarray) -> bool:
+    """
+    Match ASCII strings, stored as Arrow string buffers, against the pattern.
+
+    Return False, without matching the strings, if any of the strings
+    is not ASCII.
+    """
+    for idx in range(offsets[0], offsets[-1]):
+        if data[idx] >= 128:
+            return False
+
+    pattern_len = pattern.shape[0]
+    for row in range(out.shape[0]):
+        pos = offsets[row]
+        end = offsets[row + 1]
+        pattern_pos = 0
+        # Position of the last '%' in the pattern and in the string,
+        # used to backtrack on a mismatch.
+        any_pattern_pos = -1
+        any_pos = 0
+        is_match = True
+        while pos < end:
+            if pattern_pos < pattern_len and (
+                    pattern[pattern_pos] == _LIKE_SINGLE_CHAR
+                    or pattern[pattern_pos] == data[pos]
+            ):
+                pos += 1
+                pattern_pos += 1
+            elif (
+                    pattern_pos < pattern_len
+                    and pattern[pattern_pos] == _LIKE_ANY_CHARS
+            ):
+                any_pattern_pos = pattern_pos
+                any_pos = pos
+                pattern_pos += 1
+            elif any_pattern_pos >= 0:
+                pattern_pos = any_pattern_pos + 1
+                any_pos += 1
+                pos = any_pos
+            else:
+                is_match = False
+                break
+        if is_match:
+            while (
+                    pattern_pos < pattern_len
+                    and pattern[pattern_pos] == _LIKE_ANY_CHARS
+            ):
+                pattern_pos += 1
+            is_match = pattern_pos == pattern_len
+        out[row] = is_match
+    return True
+
+
+if numba is not None:
+    _like_ascii_kernel = numba.njit(nogil=True)(_like_ascii_kernel)
+
+
 class LikeFunction(VectorizedExpression):
     """
     LIKE function.
@@ -318,26 +421,133 @@ class LikeFunction(VectorizedExpression):
     def __init__(self,
                  arguments: Tuple[Union[Column, VectorizedExpression], Literal],
                  invert: bool) -> None:
+        # Columns are passed as Arrow arrays, for the kernel
+        # to match the strings directly in the Arrow buffers.
         super().__init__(arguments=arguments,
-                         is_numpy_func=True)
+                         is_numpy_func=False)
         self.invert = invert
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _compile_regex_pattern(pattern: str) -> re.Pattern:
         assert pattern is not None
         pattern = pattern.replace('_', '.')
         pattern = pattern.replace('%', '.*')
-        pattern = f'^{pattern}$'
-        return re.compile(pattern)
+        # Wildcards match line breaks as well, the same as
+        # the string methods and the kernel do.
+        return re.compile(pattern, re.DOTALL)
 
-    def _like(self, column: AnyArrayLike, pattern: str) -> Iterable[bool]:
-        def re_lambda(val):
-            return bool(compiled_pattern.match(val)) != self.invert
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _string_method(pattern: str) -> Tuple[Optional[Callable], str]:
+        """
+        Return a string method equivalent to the pattern and its operand.
+
+        Patterns without `_` and with `%` only at the start and/or the end,
+        ie 'abc%', '%abc' or '%abc%', are matched with string methods, which
+        is faster than matching a regular expression.
+        Method is None if the pattern needs a regular expression.
+        """
+        assert pattern is not None
+        has_prefix_wildcard = pattern.startswith('%')
+        has_suffix_wildcard = len(pattern) > 1 and pattern.endswith('%')
+        operand = pattern[int(has_prefix_wildcard):
+                          len(pattern) - int(has_suffix_wildcard)]
+        if (
+                '_' in operand
+                or '%' in operand
+                or not _REGEX_SPECIAL_CHARS.isdisjoint(operand)
+        ):
+            return None, pattern
+        return (_LIKE_STRING_METHODS[(has_prefix_wildcard,
+                                      has_suffix_wildcard)],
+                operand)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _kernel_pattern(pattern: str) -> Optional[np.ndarray]:
+        """
+        Return the pattern encoded for the LIKE kernel.
+
+        None if the pattern is not ASCII or has regex special characters,
+        which are matched by the regular expressions.
+        """
+        assert pattern is not None
+        if (
+                not pattern.isascii()
+                or not _REGEX_SPECIAL_CHARS.isdisjoint(pattern)
+        ):
+            return None
+        codes = {'%': _LIKE_ANY_CHARS, '_': _LIKE_SINGLE_CHAR}
+        return np.array([codes.get(char, ord(char)) for char in pattern],
+                        dtype=np.int16)
+
+    def _like_kernel(self,
+                     column: AnyArrayLike,
+                     pattern: str) -> Optional[np.ndarray]:
+        """
+        Match the pattern with the compiled kernel, directly on
+        the Arrow string buffers, without converting the strings
+        to Python objects.
+
+        Return None if the kernel can't be used: Numba is not installed,
+        column is not an Arrow string array without Nulls or
+        the strings are not ASCII.
+        """
+        if (
+                numba is None
+                or not isinstance(column, pa.Array)
+                or not pa.types.is_string(column.type)
+                or column.null_count
+        ):
+            return None
+        kernel_pattern = self._kernel_pattern(pattern)
+        if kernel_pattern is None:
+            return None
+
+        _, offsets_buffer, data_buffer = column.buffers()
+        offsets = np.frombuffer(offsets_buffer, dtype=np.int32)[
+            column.offset:column.offset + len(column) + 1
+        ]
+        if data_buffer is None:
+            data = np.empty(0, dtype=np.uint8)
+        else:
+            data = np.frombuffer(data_buffer, dtype=np.uint8)
 
-        compiled_pattern = self._compile_regex_pattern(pattern)
-        re_func = np.vectorize(re_lambda)
+        mask = np.empty(len(column), dtype=np.bool_)
+        if not _like_ascii_kernel(data, offsets, kernel_pattern, mask):
+            return None
+        return mask
+
+    def _like(self, column: AnyArrayLike, pattern: str) -> Iterable[bool]:
+        mask = self._like_kernel(column, pattern)
+        if mask is not None:
+            if self.invert:
+                np.logical_not(mask, out=mask)
+            return mask
+
+        if is_pyarrow_array(column):
+            values = arrow_to_numpy(column)
+        else:
+            values = np.asarray(column)
+        is_scalar = values.ndim == 0
+        if is_scalar:
+            values = values.reshape(1)
+
+        # Mapping the matching function over the values avoids
+        # the per element overhead of numpy.vectorize.
+        method, operand = self._string_method(pattern)
+        if method is not None:
+            mask = np.array(list(map(method, values, repeat(operand))),
+                            dtype=np.bool_)
+        else:
+            match = self._compile_regex_pattern(pattern).fullmatch
+            mask = np.array([res is not None for res in map(match, values)],
+                            dtype=np.bool_)
 
-        return re_func(column)
+        if self.invert:
+            np.logical_not(mask, out=mask)
+        return mask.reshape(()) if is_scalar else mask
 
     def _expr_kernel(self, arguments: Any, table: ArrowTable) -> Any:
         column, pattern = arguments
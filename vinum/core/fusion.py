@@ -0,0 +1,382 @@
+import math
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+from vinum._typing import OperatorArgument
+from vinum.arrow.record_batch import RecordBatch
+from vinum.core.base import VectorizedExpression
+from vinum.parser.query import Column, Literal, SQLOperator
+
+
+# Element-wise operators which can be fused, mapped to the source
+# templates of a single element computation.
+ARITHMETIC_OPERATORS = {
+    SQLOperator.ADDITION: '({} + {})',
+    SQLOperator.SUBTRACTION: '({} - {})',
+    SQLOperator.MULTIPLICATION: '({} * {})',
+    SQLOperator.DIVISION: '({} / {})',
+}
+
+COMPARISON_OPERATORS = {
+    SQLOperator.EQUALS: '({} == {})',
+    SQLOperator.NOT_EQUALS: '({} != {})',
+    SQLOperator.GREATER_THAN: '({} > {})',
+    SQLOperator.GREATER_THAN_OR_EQUAL: '({} >= {})',
+    SQLOperator.LESS_THAN: '({} < {})',
+    SQLOperator.LESS_THAN_OR_EQUAL: '({} <= {})',
+}
+
+RANGE_OPERATORS = {
+    SQLOperator.BETWEEN: '(({0} >= {1}) and ({0} <= {2}))',
+    SQLOperator.NOT_BETWEEN: '(({0} < {1}) or ({0} > {2}))',
+}
+
+# Boolean operators are fused only over boolean subexpressions,
+# i.e. fused comparisons, ranges and IN lists.
+BOOLEAN_OPERATORS = {
+    SQLOperator.AND: ' and ',
+    SQLOperator.OR: ' or ',
+}
+
+# IN lists are fused into a chain of comparisons, one per value,
+# hence only the short ones.
+MAX_FUSED_IN_LIST_SIZE = 16
+
+# Only for these input types the result of the fused kernel is guaranteed
+# to be the same (including the result dtype) as of Numpy functions.
+FUSED_INPUT_DTYPES = (np.dtype(np.int64), np.dtype(np.float64))
+
+INT64_MIN = np.iinfo(np.int64).min
+INT64_MAX = np.iinfo(np.int64).max
+
+_compile_lock = threading.Lock()
+
+
+class _Node:
+    """
+    Scalar expression of the fused kernel.
+
+    Parameters
+    ----------
+    source : str
+        Python source of the expression, columns are referenced
+        by `{col_N}` placeholders.
+    kind : str
+        'numeric' or 'bool'.
+    result_dtype : Callable[[Sequence[np.dtype]], np.dtype]
+        Return the dtype of the result, given the dtypes of the columns.
+    """
+    def __init__(self,
+                 source: str,
+                 kind: str,
+                 result_dtype: Callable[[Sequence[np.dtype]], np.dtype]
+                 ) -> None:
+        self.source = source
+        self.kind = kind
+        self.result_dtype = result_dtype
+
+
+class FusedExpression(VectorizedExpression):
+    """
+    Fused Expression.
+
+    Tree of arithmetic, comparison, range, IN and boolean operators,
+    compiled with Numba into a single loop over the input columns.
+    Unlike the evaluation of the tree node by node, no intermediate
+    arrays are allocated.
+
+    The kernel is used only if all the input columns are int64 or float64
+    Numpy arrays, otherwise the original expression tree is evaluated.
+
+    Parameters
+    ----------
+    columns : Sequence[Column]
+        Input columns of the expression.
+    node : _Node
+        Scalar expression.
+    fallback : VectorizedExpression
+        Expression tree to evaluate if the kernel can't be used.
+    """
+    def __init__(self,
+                 columns: Sequence[Column],
+                 node: _Node,
+                 fallback: VectorizedExpression) -> None:
+        super().__init__(arguments=columns, is_numpy_func=True)
+        self._node = node
+        self._fallback = fallback
+        self._source = _kernel_source(node.source, len(columns))
+
+    def evaluate(self, batch: RecordBatch) -> Any:
+        arrays = self._process_arguments(self._arguments, batch)
+        dtypes = tuple(arr.dtype for arr in arrays)
+        if not all(dtype in FUSED_INPUT_DTYPES for dtype in dtypes):
+            return self._fallback.evaluate(batch)
+
+        out = np.empty(len(arrays[0]), dtype=self._node.result_dtype(dtypes))
+        _compile_kernel(self._source)(*arrays, out)
+        return out
+
+    def str_lines_repr(self, indent_level: int,) -> Tuple:
+        lines = [
+            f'{self._level_indent_string(indent_level)}'
+            f'VectorizedExpression: {self.__class__.__name__}',
+            f'{self._level_indent_string(indent_level + 1)}'
+            f'{self._node.source.format(**_column_names(self._arguments))}',
+        ]
+        lines.append('')
+        return tuple(lines)
+
+    @property
+    def columns(self) -> Tuple[Column, ...]:
+        return tuple(self._arguments)   # type: ignore
+
+    @property
+    def node(self) -> _Node:
+        return self._node
+
+
+def _column_names(columns: Sequence[OperatorArgument]) -> Dict[str, str]:
+    return {
+        f'col_{idx}': col.get_column_name()  # type: ignore
+        for idx, col in enumerate(columns)
+    }
+
+
+def _kernel_source(expression_source: str, num_columns: int) -> str:
+    col_args = [f'col_{idx}' for idx in range(num_columns)]
+    element = expression_source.format(
+        **{name: f'{name}[i]' for name in col_args}
+    )
+    return (
+        f'def fused_kernel({", ".join(col_args)}, out):\n'
+        f'    for i in range(out.shape[0]):\n'
+        f'        out[i] = {element}\n'
+    )
+
+
+@lru_cache(maxsize=256)
+def _compile_kernel(source: str) -> Callable:
+    """
+    Compile kernel source with Numba.
+
+    Kernels are cached by the source, hence shared between the queries.
+    Numba compiles the kernel for given argument types on the first call.
+    """
+    namespace: Dict[str, Any] = {}
+    with _compile_lock:
+        exec(compile(source, '<vinum-fused-kernel>', 'exec'), namespace)
+        return numba.njit(nogil=True, error_model='numpy')(
+            namespace['fused_kernel']
+        )
+
+
+def _numeric_result(*dtype_funcs: Callable,
+                    is_division: bool = False) -> Callable:
+    def result_dtype(dtypes: Sequence[np.dtype]) -> np.dtype:
+        if is_division:
+            return np.dtype(np.float64)
+        return np.result_type(*(func(dtypes) for func in dtype_funcs))
+    return result_dtype
+
+
+def _bool_result(dtypes: Sequence[np.dtype]) -> np.dtype:
+    return np.dtype(np.bool_)
+
+
+def _literal_source(value: Any) -> Optional[str]:
+    if type(value) == int and INT64_MIN <= value <= INT64_MAX:
+        return f'({value!r})'
+    elif type(value) == float and math.isfinite(value):
+        return f'({value!r})'
+    return None
+
+
+def _fuse_in_list(sql_operator: SQLOperator,
+                  arguments: Sequence[OperatorArgument],
+                  expression: VectorizedExpression
+                  ) -> Optional[FusedExpression]:
+    if len(arguments) != 2 or not isinstance(arguments[1], Literal):
+        return None
+    values = arguments[1].value
+    if (
+            not isinstance(values, (list, tuple))
+            or not 0 < len(values) <= MAX_FUSED_IN_LIST_SIZE
+    ):
+        return None
+
+    columns: List[Column] = []
+    node = _to_node(arguments[0], columns)
+    if node is None or node.kind != 'numeric' or not columns:
+        return None
+
+    values_sources = [_literal_source(value) for value in values]
+    if None in values_sources:
+        return None
+
+    if sql_operator == SQLOperator.IN:
+        source = ' or '.join(
+            f'({node.source} == {value})' for value in values_sources
+        )
+    else:
+        source = ' and '.join(
+            f'({node.source} != {value})' for value in values_sources
+        )
+    return FusedExpression(columns,
+                           _Node(f'({source})', 'bool', _bool_result),
+                           expression)
+
+
+def _fuse_boolean(sql_operator: SQLOperator,
+                  arguments: Sequence[OperatorArgument],
+                  expression: VectorizedExpression
+                  ) -> Optional[FusedExpression]:
+    if sql_operator == SQLOperator.NOT and len(arguments) != 1:
+        return None
+    if sql_operator in BOOLEAN_OPERATORS and len(arguments) < 2:
+        return None
+
+    columns: List[Column] = []
+    sources = []
+    for arg in arguments:
+        if not isinstance(arg, FusedExpression):
+            return None
+        node = _to_node(arg, columns)
+        if node is None or node.kind != 'bool':
+            return None
+        sources.append(node.source)
+
+    if sql_operator == SQLOperator.NOT:
+        source = f'(not {sources[0]})'
+    else:
+        source = f'({BOOLEAN_OPERATORS[sql_operator].join(sources)})'
+    return FusedExpression(columns,
+                           _Node(source, 'bool', _bool_result),
+                           expression)
+
+
+def _to_node(argument: OperatorArgument,
+             columns: List[Column]) -> Optional[_Node]:
+    if isinstance(argument, FusedExpression):
+        if argument.is_shared():
+            return None
+        offset = len(columns)
+        columns.extend(argument.columns)
+        inner_names = {
+            f'col_{idx}': f'{{col_{offset + idx}}}'
+            for idx in range(len(argument.columns))
+        }
+        node = argument.node
+        inner_dtype = node.result_dtype
+        num_inner = len(argument.columns)
+        return _Node(
+            node.source.format(**inner_names),
+            node.kind,
+            lambda dtypes: inner_dtype(dtypes[offset:offset + num_inner])
+        )
+    elif isinstance(argument, Column):
+        idx = len(columns)
+        columns.append(argument)
+        return _Node(f'{{col_{idx}}}', 'numeric', lambda dtypes: dtypes[idx])
+    elif isinstance(argument, Literal):
+        source = _literal_source(argument.value)
+        if source is not None:
+            dtype = np.dtype(
+                np.int64 if type(argument.value) == int else np.float64
+            )
+            return _Node(source, 'numeric', lambda dtypes: dtype)
+    return None
+
+
+def fuse_expression(sql_operator: SQLOperator,
+                    arguments: Sequence[OperatorArgument],
+                    expression: VectorizedExpression
+                    ) -> Optional[FusedExpression]:
+    """
+    Fuse arithmetic, comparison, range or boolean expression
+    with its arguments.
+
+    Expression is fused if Numba is installed and all its arguments are
+    columns, numeric literals or non-shared fused expressions.
+    IN / NOT IN are fused if the list has at most
+    `MAX_FUSED_IN_LIST_SIZE` numeric literals.
+    AND / OR / NOT are fused if all the arguments are fused
+    boolean expressions.
+
+    Parameters
+    ----------
+    sql_operator : SQLOperator
+        SQL operator of the expression.
+    arguments : Sequence[OperatorArgument]
+        Arguments of the expression.
+    expression : VectorizedExpression
+        Expression, used as a fallback.
+
+    Returns
+    -------
+    Optional[FusedExpression]
+        Fused expression or None if the expression can't be fused.
+    """
+    if numba is None:
+        return None
+    if sql_operator in (SQLOperator.IN, SQLOperator.NOT_IN):
+        return _fuse_in_list(sql_operator, arguments, expression)
+    if sql_operator == SQLOperator.NOT or sql_operator in BOOLEAN_OPERATORS:
+        return _fuse_boolean(sql_operator, arguments, expression)
+    if (
+            sql_operator not in ARITHMETIC_OPERATORS
+            and sql_operator not in COMPARISON_OPERATORS
+            and sql_operator not in RANGE_OPERATORS
+    ):
+        return None
+    if sql_operator in COMPARISON_OPERATORS and len(arguments) != 2:
+        return None
+    if sql_operator in RANGE_OPERATORS and len(arguments) != 3:
+        return None
+    if len(arguments) < 2:
+        return None
+
+    columns: List[Column] = []
+    nodes = []
+    for arg in arguments:
+        node = _to_node(arg, columns)
+        if node is None or node.kind != 'numeric':
+            return None
+        nodes.append(node)
+    if not columns:
+        return None
+
+    if sql_operator in COMPARISON_OPERATORS:
+        template = COMPARISON_OPERATORS[sql_operator]
+        fused = _Node(template.format(nodes[0].source, nodes[1].source),
+                      'bool',
+                      _bool_result)
+    elif sql_operator in RANGE_OPERATORS:
+        # Both bounds are checked in a single pass, without allocating
+        # the intermediate boolean arrays.
+        template = RANGE_OPERATORS[sql_operator]
+        fused = _Node(template.format(*(node.source for node in nodes)),
+                      'bool',
+                      _bool_result)
+    else:
+        # Binary operators are applied left to right to all the arguments.
+        template = ARITHMETIC_OPERATORS[sql_operator]
+        is_division = sql_operator == SQLOperator.DIVISION
+        fused = nodes[0]
+        for node in nodes[1:]:
+            fused = _Node(
+                template.format(fused.source, node.source),
+                'numeric',
+                _numeric_result(fused.result_dtype,
+                                node.result_dtype,
+                                is_division=is_division)
+            )
+
+    return FusedExpression(columns, fused, expression)
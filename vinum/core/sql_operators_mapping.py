@@ -1,4 +1,4 @@
-from functools import partial
+import operator
 
 import numpy as np
 import pyarrow.compute as pc
@@ -9,9 +9,42 @@ from vinum.core.functions import (
 )
 from vinum.parser.query import SQLOperator
 
+
+def _between(x, low, high):
+    return np.logical_and(x >= low, x <= high)
+
+
+def _not_between(x, low, high):
+    return np.logical_or(x < low, x > high)
+
+
+def _in(x, values, invert=False):
+    # np.isin sorts the values for object arrays (e.g. strings),
+    # a hash set lookup is a single pass over the column instead.
+    # Numeric arrays are left to np.isin, which compares
+    # with each value in turn when the list is short.
+    if isinstance(x, np.ndarray) and x.dtype == object:
+        try:
+            value_set = frozenset(values)
+        except TypeError:
+            pass
+        else:
+            mask = np.fromiter((val in value_set for val in x),
+                               dtype=np.bool_,
+                               count=len(x))
+            if invert:
+                np.logical_not(mask, out=mask)
+            return mask
+    return np.isin(x, values, invert=invert)
+
+
+def _not_in(x, values):
+    return _in(x, values, invert=True)
+
+
 SQL_OPERATOR_FUNCTIONS = {
     SQLOperator.NEGATION: (np.negative, FunctionType.NUMPY),
-    SQLOperator.BINARY_NOT: (lambda x: ~x, FunctionType.NUMPY),
+    SQLOperator.BINARY_NOT: (operator.invert, FunctionType.NUMPY),
     SQLOperator.BINARY_AND: (np.bitwise_and, FunctionType.NUMPY),
     SQLOperator.BINARY_OR: (np.bitwise_or, FunctionType.NUMPY),
     SQLOperator.BINARY_XOR: (np.bitwise_xor, FunctionType.NUMPY),
@@ -27,32 +60,27 @@ SQL_OPERATOR_FUNCTIONS = {
     SQLOperator.AND: (pc.and_, FunctionType.ARROW),
     SQLOperator.OR: (pc.or_, FunctionType.ARROW),
     SQLOperator.NOT: (pc.invert, FunctionType.ARROW),
-    SQLOperator.EQUALS: (lambda x, y: x == y, FunctionType.NUMPY),
-    SQLOperator.NOT_EQUALS: (lambda x, y: x != y, FunctionType.NUMPY),
-    SQLOperator.GREATER_THAN: (lambda x, y: x > y, FunctionType.NUMPY),
-    SQLOperator.GREATER_THAN_OR_EQUAL:
-        (lambda x, y: x >= y, FunctionType.NUMPY),
-    SQLOperator.LESS_THAN: (lambda x, y: x < y, FunctionType.NUMPY),
-    SQLOperator.LESS_THAN_OR_EQUAL: (lambda x, y: x <= y, FunctionType.NUMPY),
+    SQLOperator.EQUALS: (operator.eq, FunctionType.NUMPY),
+    SQLOperator.NOT_EQUALS: (operator.ne, FunctionType.NUMPY),
+    SQLOperator.GREATER_THAN: (operator.gt, FunctionType.NUMPY),
+    SQLOperator.GREATER_THAN_OR_EQUAL: (operator.ge, FunctionType.NUMPY),
+    SQLOperator.LESS_THAN: (operator.lt, FunctionType.NUMPY),
+    SQLOperator.LESS_THAN_OR_EQUAL: (operator.le, FunctionType.NUMPY),
     SQLOperator.IS_NULL: (pc.is_null, FunctionType.ARROW),
     SQLOperator.IS_NOT_NULL: (pc.is_valid, FunctionType.ARROW),
-    SQLOperator.IN: (np.isin, FunctionType.NUMPY),
-    SQLOperator.NOT_IN: (partial(np.isin, invert=True), FunctionType.NUMPY),
+    SQLOperator.IN: (_in, FunctionType.NUMPY),
+    SQLOperator.NOT_IN: (_not_in, FunctionType.NUMPY),
 
     # SQL specific operators
-    SQLOperator.BETWEEN:
-        (lambda x, low, high: np.logical_and(x >= low, x <= high),
-         FunctionType.NUMPY),
-    SQLOperator.NOT_BETWEEN:
-        (lambda x, low, high: np.logical_or(x < low, x > high),
-         FunctionType.NUMPY),
+    SQLOperator.BETWEEN: (_between, FunctionType.NUMPY),
+    SQLOperator.NOT_BETWEEN: (_not_between, FunctionType.NUMPY),
 
     # String operators
     SQLOperator.CONCAT: (ConcatFunction, FunctionType.CLASS),
 }
 
 
-BINARY_OPERATORS = {
+BINARY_OPERATORS = frozenset({
     SQLOperator.ADDITION,
     SQLOperator.SUBTRACTION,
     SQLOperator.MULTIPLICATION,
@@ -66,4 +94,4 @@ BINARY_OPERATORS = {
     SQLOperator.GREATER_THAN_OR_EQUAL,
     SQLOperator.LESS_THAN,
     SQLOperator.LESS_THAN_OR_EQUAL,
-}
+})
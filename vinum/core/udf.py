@@ -1,11 +1,21 @@
+from functools import lru_cache
+
 import numpy as np
-from typing import Dict, Callable, Tuple
+from typing import Dict, Callable, Set, Tuple
+
+try:
+    import numba
+    from numba.core.errors import NumbaError
+except ImportError:
+    numba = None
 
 from vinum.core.functions import (
     _default_functions_registry, FunctionType, )
 from vinum.errors import FunctionError
 
 _udf_registry: Dict[str, Callable] = {}
+_parallel_safe_udfs: Set[str] = set()
+_numpy_udfs: Set[str] = set()
 
 
 def _ensure_function_name_correctness(name: str) -> str:
@@ -14,15 +24,73 @@ def _ensure_function_name_correctness(name: str) -> str:
     return name.lower()
 
 
-def _register_udf(name: str, function) -> None:
+def _register_udf(name: str,
+                  function,
+                  parallel_safe: bool,
+                  is_numpy_udf: bool) -> None:
     function_name = _ensure_function_name_correctness(name)
-    _remove_udf(name)
+    _remove_udf(function_name)
     _udf_registry[function_name] = function
+    if parallel_safe:
+        _parallel_safe_udfs.add(function_name)
+    if is_numpy_udf:
+        _numpy_udfs.add(function_name)
 
 
 def _remove_udf(name: str) -> None:
     if name in _udf_registry:
         del _udf_registry[name]
+    _parallel_safe_udfs.discard(name)
+    _numpy_udfs.discard(name)
+
+
+def _python_udf_kernel(function: Callable, jit: bool = False) -> Callable:
+    """
+    Return array kernel for a scalar Python function.
+
+    By default, the function is vectorized with ``numpy.vectorize``.
+    If `jit` is set and Numba is installed, the function is compiled
+    into a ufunc for the types of the arguments it is called with.
+    If Numba fails to compile the function for given types
+    (e.g. the function operates on strings), ``numpy.vectorize`` is used.
+    The choice is made once per types of the arguments, hence all
+    the batches of the same types are processed the same way.
+    """
+    np_vectorized = np.vectorize(function)
+    if not jit or numba is None:
+        return np_vectorized
+
+    try:
+        jit_vectorized = numba.vectorize(nopython=True)(function)
+    except TypeError:
+        # Not a Python function, e.g. a builtin.
+        return np_vectorized
+
+    # Argument types the function can't be compiled for.
+    unsupported_signatures: Set[Tuple] = set()
+
+    def kernel(*args):
+        signature = tuple(getattr(arg, 'dtype', type(arg)) for arg in args)
+        if signature not in unsupported_signatures:
+            try:
+                return jit_vectorized(*args)
+            except NumbaError:
+                unsupported_signatures.add(signature)
+        return np_vectorized(*args)
+
+    return kernel
+
+
+@lru_cache(maxsize=128)
+def _lookup_numpy_function(function_name: str) -> Callable:
+    """
+    Resolve dotted 'np.' function name, ie 'np.linalg.norm',
+    attribute by attribute, without evaluating the name.
+    """
+    func = np
+    for attr in function_name.split('.')[1:]:
+        func = getattr(func, attr)
+    return func
 
 
 def lookup_udf(function_name: str) -> Tuple[Callable, FunctionType]:
@@ -30,7 +98,7 @@ def lookup_udf(function_name: str) -> Tuple[Callable, FunctionType]:
     Return UDF by name.
 
     If function is a numpy function, ie it starts with a
-    reserved namespace 'np.', its definition is evaluated via `eval`
+    reserved namespace 'np.', it is looked up in the numpy package
     and resulting Callable returned.
 
     Parameters
@@ -47,9 +115,9 @@ def lookup_udf(function_name: str) -> Tuple[Callable, FunctionType]:
 
     if function_name.startswith('np.'):
         try:
-            func = eval(function_name)
+            func = _lookup_numpy_function(function_name)
             func_type = FunctionType.NUMPY
-        except (NameError, AttributeError):
+        except AttributeError:
             raise FunctionError(
                 f"Numpy function '{function_name}' is not found "
                 "in the numpy package."
@@ -64,7 +132,64 @@ def lookup_udf(function_name: str) -> Tuple[Callable, FunctionType]:
     return func, func_type
 
 
-def register_python(function_name: str, function) -> None:
+def is_parallel_safe_function(function_name: str) -> bool:
+    """
+    Return True if the function may be called concurrently,
+    from several threads.
+
+    Numpy and built-in functions are parallel safe, UDFs only
+    if they are registered as such.
+
+    Parameters
+    ----------
+    function_name : str
+        Name of the function.
+
+    Returns
+    -------
+    bool
+        True if the function is parallel safe.
+    """
+    function_name = _ensure_function_name_correctness(function_name)
+    if (
+            function_name.startswith('np.')
+            or function_name in _default_functions_registry
+            or function_name not in _udf_registry
+    ):
+        return True
+    return function_name in _parallel_safe_udfs
+
+
+def requires_unicode_dtype(function_name: str) -> bool:
+    """
+    Return True if string columns have to be passed to the function
+    as arrays of the fixed width unicode dtype.
+
+    Functions from the `np.` namespace, such as ``np.char.upper``,
+    and Numpy UDFs may not accept 'object' typed string arrays.
+
+    Parameters
+    ----------
+    function_name : str
+        Name of the function.
+
+    Returns
+    -------
+    bool
+        True if string arguments have to be of unicode dtype.
+    """
+    function_name = _ensure_function_name_correctness(function_name)
+    if function_name.startswith('np.'):
+        return True
+    elif function_name in _default_functions_registry:
+        return False
+    return function_name in _numpy_udfs
+
+
+def register_python(function_name: str,
+                    function,
+                    parallel_safe: bool = False,
+                    jit: bool = False) -> None:
     """
     Register Python function as a User Defined Function (UDF).
 
@@ -74,6 +199,13 @@ def register_python(function_name: str, function) -> None:
         Name of the User Defined Function.
     function: callable, python function
         Function to be used as a UDF.
+    parallel_safe: bool
+        Whether the function may be called concurrently, from several
+        threads. Batches of the queries using the function are processed
+        sequentially, unless it is set.
+    jit: bool
+        Compile the function with ``numba.vectorize``, if
+        `Numba <https://numba.pydata.org>`_ is installed.
 
     See also
     --------
@@ -82,6 +214,13 @@ def register_python(function_name: str, function) -> None:
     Notes
     -----
     Python functions are "vectorized" before use, via ``numpy.vectorize``.
+    If `jit` is set, functions are compiled with ``numba.vectorize``
+    instead, falling back to ``numpy.vectorize`` for the argument types
+    the compilation fails for. Compiled functions follow the Numpy
+    error model: integer division by zero returns 0, float division
+    by zero returns inf, math domain errors return NaN and integer
+    overflow wraps around, rather than raising. Exceptions raised
+    explicitly by the function are propagated.
     For better performance, please try to use numpy UDFs,
     operating in terms of numpy arrays. See :func:`vinum.register_numpy`.
 
@@ -131,11 +270,13 @@ def register_python(function_name: str, function) -> None:
     1  0.909297  0.420167
     2  0.841471  0.656987
     """
-    function = np.vectorize(function)
-    _register_udf(function_name, function)
+    function = _python_udf_kernel(function, jit=jit)
+    _register_udf(function_name, function, parallel_safe, False)
 
 
-def register_numpy(function_name: str, function) -> None:
+def register_numpy(function_name: str,
+                   function,
+                   parallel_safe: bool = False) -> None:
     """
     Register Numpy function as a User Defined Function (UDF).
     UDF can perform vectorized operations on arrays passed as arguments.
@@ -151,6 +292,11 @@ def register_numpy(function_name: str, function) -> None:
         Numpy arrays will be passed as input arguments to the function
         and it should return numpy array.
 
+    parallel_safe: bool
+        Whether the function may be called concurrently, from several
+        threads. Batches of the queries using the function are processed
+        sequentially, unless it is set.
+
     See also
     --------
     register_python : Register Python function as a User Defined Function.
@@ -161,6 +307,8 @@ def register_numpy(function_name: str, function) -> None:
     You can invoke any function from the `np.*` namespace.
 
     Arguments of the function would be numpy arrays of provided columns.
+    String columns without Nulls are passed as numpy arrays of
+    the fixed width unicode dtype.
     UDF can perform vectorized operations on arrays passed as arguments.
     The function would be called only once.
 
@@ -215,4 +363,4 @@ def register_numpy(function_name: str, function) -> None:
 
     Please note that `x` argument is of `np.array` type.
     """
-    _register_udf(function_name, function)
+    _register_udf(function_name, function, parallel_safe, True)
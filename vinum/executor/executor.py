@@ -1,3 +1,5 @@
+import warnings
+
 from vinum.arrow.arrow_table import ArrowTable
 from vinum.core.base import Operator
 
@@ -23,9 +25,22 @@ class Executor:
 
 class RecursiveExecutor(Executor):
     """
-    Single-Threaded Recursive Executor.
+    Recursive Executor.
 
     Execute the query plan recursively.
+    Operators without a state, such as Project or Filter,
+    process independent batches in parallel, in a shared thread pool.
+
+    RuntimeWarnings are silenced for the duration of the query with
+    ``warnings.catch_warnings``, which is not thread safe. Warning filters
+    are global to the process, hence, if queries are executed in several
+    threads at once, RuntimeWarnings are silenced for the code running
+    concurrently as well, and the filters in effect may be restored
+    out of order once the queries complete.
     """
     def execute(self, operator: Operator) -> ArrowTable:
-        return next(operator.next())
+        # Warning filters are global to the process, hence they are set
+        # once per query and not in the worker threads.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            return next(operator.next())
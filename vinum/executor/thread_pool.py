@@ -0,0 +1,66 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, Any
+
+# Leave one core to the thread consuming the results.
+MAX_WORKERS = max((os.cpu_count() or 1) - 1, 1)
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_thread_pool_lock = threading.Lock()
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """
+    Return the thread pool shared by all the queries.
+
+    Pool is created on the first call.
+    """
+    global _thread_pool
+    if _thread_pool is None:
+        with _thread_pool_lock:
+            if _thread_pool is None:
+                _thread_pool = ThreadPoolExecutor(
+                    max_workers=MAX_WORKERS,
+                    thread_name_prefix='vinum'
+                )
+    return _thread_pool
+
+
+def ordered_parallel_map(func: Callable[[Any], Any],
+                         items: Iterable[Any]) -> Iterator[Any]:
+    """
+    Apply function to every item in the shared thread pool.
+
+    Results are yielded in the order of the input items.
+    At most `MAX_WORKERS` items are processed ahead of the consumer,
+    which bounds the memory used by the pending results.
+
+    Since function calls execute concurrently, the function must not
+    modify any shared state. Numpy and Arrow kernels release the GIL,
+    which allows them to run in parallel.
+
+    Parameters
+    ----------
+    func : Callable[[Any], Any]
+        Function to apply.
+    items : Iterable[Any]
+        Input items.
+
+    Returns
+    -------
+    Iterator[Any]
+        Results of the function, in the order of the input items.
+    """
+    submit = get_thread_pool().submit
+    pending: deque = deque()
+    # Bound methods are looked up once, rather than for every item.
+    append = pending.append
+    popleft = pending.popleft
+    for item in items:
+        append(submit(func, item))
+        if len(pending) >= MAX_WORKERS:
+            yield popleft().result()
+    while pending:
+        yield popleft().result()
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, Any
 
 import pyarrow as pa
@@ -20,6 +21,25 @@ from vinum.util.util import (
 )
 
 
+@lru_cache(maxsize=256)
+def _parse_select_statement(sql: str) -> Dict[str, Any]:
+    """
+    Parse SQL statement with pglast and return the SELECT statement tree.
+
+    Parse trees are cached by the SQL string. Tree is only read while
+    building the Query AST, hence it is safe to share it between
+    the parser instances of the same query.
+    """
+    root_node = Node(parse_sql(sql))
+
+    assert len(root_node) == 1
+    statement = root_node[0].parse_tree['stmt']
+    if 'SelectStmt' not in statement:
+        raise ParserError('Only SELECT statements are supported.')
+
+    return statement['SelectStmt']
+
+
 class AbstractSqlParser:
     """
     Abstract SQL Parser.
@@ -92,14 +112,7 @@ class PglastParser(AbstractSqlParser):
         self._sql_parsed: Dict[str, Any] = {}
 
     def _parse(self):
-        root_node = Node(parse_sql(self._sql))
-
-        assert len(root_node) == 1
-        statement = root_node[0].parse_tree['stmt']
-        if 'SelectStmt' not in statement:
-            raise ParserError('Only SELECT statements are supported.')
-
-        return statement['SelectStmt']
+        return _parse_select_statement(self._sql)
 
     def _unpack_literal(self, val: dict):
         if 'String' in val:
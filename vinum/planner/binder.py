@@ -152,7 +152,7 @@ class Binder:
         """
         if is_column(expr):
             column_name = expr.get_column_name()
-            if column_name not in schema.names:
+            if not schema.get_all_field_indices(column_name):
                 raise ParserError(
                     f"Column '{column_name}' is not found."
                 )
@@ -21,6 +21,8 @@ from typing import (
 from vinum.core.aggregate import AggregateOperator, AggregateFunction
 from vinum.core.udf import (
     lookup_udf,
+    is_parallel_safe_function,
+    requires_unicode_dtype,
 )
 from vinum.core.algebra import (
     SortOperator,
@@ -38,6 +40,7 @@ from vinum.core.functions import (
     FunctionType,
     ensure_numpy_mapping,
 )
+from vinum.core.fusion import fuse_expression
 from vinum.core.sql_operators_mapping import (
     SQL_OPERATOR_FUNCTIONS,
     BINARY_OPERATORS, )
@@ -105,7 +108,9 @@ class QueryPlanner:
             kernel: Union[Callable, Type[VectorizedExpression]],
             arguments: Iterable['OperatorArgument'],
             func_type: FunctionType,
-            is_binary_func: bool = False
+            is_binary_func: bool = False,
+            parallel_safe: bool = True,
+            force_unicode_dtype: bool = False
     ) -> VectorizedExpression:
         """
         Instantiate VectorizedExpression.
@@ -120,6 +125,10 @@ class QueryPlanner:
             Function type: Arrow, Numpy or Class.
         is_binary_func : bool
             Is binary args function.
+        parallel_safe : bool
+            Whether the function may be called from several threads.
+        force_unicode_dtype : bool
+            Pass string columns as arrays of the fixed width unicode dtype.
 
         Returns
         -------
@@ -133,7 +142,9 @@ class QueryPlanner:
                 arguments=arguments,
                 function=kernel,
                 is_numpy_func=(func_type == FunctionType.NUMPY),
-                is_binary_func=is_binary_func
+                is_binary_func=is_binary_func,
+                parallel_safe=parallel_safe,
+                force_unicode_dtype=force_unicode_dtype
             )
 
     def _process_expressions_tree(
@@ -177,14 +188,21 @@ class QueryPlanner:
                 )
             arguments.append(arg)
 
-        if expr.sql_operator in SQL_OPERATOR_FUNCTIONS.keys():
-            func, func_type = SQL_OPERATOR_FUNCTIONS[expr.sql_operator]
+        operator_function = SQL_OPERATOR_FUNCTIONS.get(expr.sql_operator)
+
+        if operator_function is not None:
+            func, func_type = operator_function
             vec_expr = self._new_vectorized_expression(
                 kernel=func,
                 arguments=arguments,
                 func_type=func_type,
                 is_binary_func=(expr.sql_operator in BINARY_OPERATORS)
             )
+            fused_expr = fuse_expression(expr.sql_operator,
+                                         arguments,
+                                         vec_expr)
+            if fused_expr is not None:
+                vec_expr = fused_expr
 
         elif expr.sql_operator in (SQLOperator.LIKE, SQLOperator.NOT_LIKE):
             vec_expr = LikeFunction(
@@ -208,7 +226,9 @@ class QueryPlanner:
                     kernel=func,
                     arguments=arguments,
                     func_type=func_type,
-                    is_binary_func=(expr.sql_operator in BINARY_OPERATORS)
+                    is_binary_func=(expr.sql_operator in BINARY_OPERATORS),
+                    parallel_safe=is_parallel_safe_function(function_name),
+                    force_unicode_dtype=requires_unicode_dtype(function_name)
                 )
 
         else:
@@ -327,6 +347,18 @@ class QueryPlanner:
 
         return tuple(column_names)
 
+    def _is_row_preserving_query(self) -> bool:
+        """
+        Return True if every input row produces exactly one output row,
+        in the same order.
+        """
+        return not (
+            self._query.where_condition
+            or self._query.is_aggregate()
+            or self._query.having
+            or self._query.order_by
+        )
+
     def plan_query(self) -> Operator:
         """
         Create a query execution plan.
@@ -343,26 +375,30 @@ class QueryPlanner:
 
         processed_shared_ids: Set[str] = set()
 
+        schema_names = self._schema.names
         used_columns = self._query.get_all_used_column_names()
-        unused_columns = set(self._schema.names) - used_columns
+        unused_columns = set(schema_names) - used_columns
         skip_table = False
         # Need to test for the cases like count(*),
         # when all columns will get removed.
         project_args = used_columns
         if unused_columns:
-            if len(unused_columns) < len(self._schema.names):
+            if len(unused_columns) < len(schema_names):
                 project_args = self._query.get_all_used_columns()
             elif self._query.has_count_star():
-                project_args = [Column(self._schema.names[0])]
+                project_args = [Column(schema_names[0])]
             else:
                 skip_table = True
 
+        reader_op = None
         if self._reader:
-          current_op = FileReaderOperator(self._reader)
+            reader_op = FileReaderOperator(self._reader)
+            current_op = reader_op
         elif skip_table:
             current_op = EmptyTableReaderOperator()
         else:
-            current_op = TableReaderOperator(self._table)
+            reader_op = TableReaderOperator(self._table)
+            current_op = reader_op
 
         if unused_columns and not skip_table:
             current_op = ProjectOperator(
@@ -497,7 +533,10 @@ class QueryPlanner:
             current_op = SliceOperator(
                 self._query.limit,  # type: ignore
                 self._query.offset,
-                current_op
+                current_op,
+                reader_operator=(
+                    reader_op if self._is_row_preserving_query() else None
+                )
             )
 
         current_op = MaterializeTableOperator(
@@ -0,0 +1,185 @@
+import pytest
+
+import numpy as np
+import pyarrow as pa
+
+from vinum.arrow.record_batch import RecordBatch
+from vinum.core.base import VectorizedExpression
+from vinum.core.sql_operators_mapping import (
+    SQL_OPERATOR_FUNCTIONS,
+    BINARY_OPERATORS,
+)
+from vinum.parser.query import Column, Literal, SQLOperator
+
+pytest.importorskip('numba')
+
+from vinum.core import fusion  # noqa: E402
+from vinum.core.fusion import FusedExpression, fuse_expression  # noqa: E402
+
+INT64_MAX = np.iinfo(np.int64).max
+INT64_MIN = np.iinfo(np.int64).min
+
+
+def _new_expression(sql_operator, arguments):
+    func, _ = SQL_OPERATOR_FUNCTIONS[sql_operator]
+    return VectorizedExpression(
+        arguments,
+        function=func,
+        is_numpy_func=True,
+        is_binary_func=sql_operator in BINARY_OPERATORS
+    )
+
+
+def _new_fused_expression(sql_operator, arguments):
+    return fuse_expression(sql_operator,
+                           arguments,
+                           _new_expression(sql_operator, arguments))
+
+
+test_batch = RecordBatch(pa.RecordBatch.from_arrays(
+    [
+        pa.array([1, 2, 0, -4], pa.int64()),
+        pa.array([3, 0, 0, 7], pa.int64()),
+        pa.array([0.5, 0.0, float('nan'), 3.0]),
+        pa.array([1, None, 3, 4], pa.int64()),
+        pa.array([1, 2, 3, 4], pa.int32()),
+        pa.array([INT64_MAX, INT64_MIN, 1, 0], pa.int64()),
+        pa.array([0.5, float('nan'), float('inf'), -1.0], pa.float32()),
+    ],
+    names=['i', 'j', 'f', 'null_i', 'i32', 'big', 'f32']
+))
+
+
+class TestFusedExpression:
+
+    @pytest.mark.parametrize("sql_operator, arguments", (
+        (SQLOperator.ADDITION, (Column('i'), Column('j'))),
+        (SQLOperator.MULTIPLICATION,
+         (Column('i'), Literal(2), Column('j'))),
+        (SQLOperator.SUBTRACTION, (Column('i'), Literal(1.5))),
+        (SQLOperator.DIVISION, (Column('i'), Column('j'))),
+        (SQLOperator.DIVISION, (Column('f'), Literal(0))),
+        (SQLOperator.GREATER_THAN, (Column('i'), Column('f'))),
+        (SQLOperator.EQUALS, (Column('f'), Column('f'))),
+        (SQLOperator.ADDITION, (Column('null_i'), Literal(1))),
+        (SQLOperator.ADDITION, (Column('i32'), Literal(1))),
+        (SQLOperator.BETWEEN, (Column('i'), Literal(0), Column('j'))),
+        (SQLOperator.BETWEEN, (Column('f'), Literal(0.0), Literal(1))),
+        (SQLOperator.NOT_BETWEEN, (Column('f'), Literal(0.0), Literal(1))),
+        (SQLOperator.NOT_BETWEEN, (Column('i'), Column('j'), Literal(2))),
+        (SQLOperator.IN, (Column('i'), Literal([1, 0, 5]))),
+        (SQLOperator.IN, (Column('f'), Literal([0.5, 3]))),
+        (SQLOperator.NOT_IN, (Column('f'), Literal([0.0, 3.0]))),
+        (SQLOperator.NOT_IN, (Column('i'), Literal([7]))),
+        # NaNs
+        (SQLOperator.NOT_EQUALS, (Column('f'), Column('f'))),
+        (SQLOperator.LESS_THAN, (Column('null_i'), Literal(2))),
+        (SQLOperator.MULTIPLICATION, (Column('f'), Column('j'))),
+        (SQLOperator.NOT_BETWEEN, (Column('f'), Literal(0), Literal(5))),
+        (SQLOperator.IN, (Column('null_i'), Literal([1, 4]))),
+        (SQLOperator.NOT_IN, (Column('f'), Literal([0.5]))),
+        # Integer overflow wraps around, as in Numpy
+        (SQLOperator.ADDITION, (Column('big'), Literal(1))),
+        (SQLOperator.SUBTRACTION, (Column('big'), Column('i'))),
+        (SQLOperator.MULTIPLICATION, (Column('big'), Literal(3))),
+        (SQLOperator.DIVISION, (Column('big'), Column('j'))),
+        (SQLOperator.GREATER_THAN, (Column('big'), Column('f'))),
+        # Inputs of other types fall back to the expression tree
+        (SQLOperator.ADDITION, (Column('f32'), Literal(0.1))),
+        (SQLOperator.MULTIPLICATION, (Column('i32'), Column('big'))),
+        (SQLOperator.BETWEEN, (Column('f32'), Literal(0), Column('f'))),
+        (SQLOperator.IN, (Column('i32'), Literal([2, 3]))),
+    ))
+    def test_same_result_as_numpy(self, sql_operator, arguments):
+        fused = _new_fused_expression(sql_operator, arguments)
+        assert isinstance(fused, FusedExpression)
+
+        expected = _new_expression(sql_operator, arguments).evaluate(
+            test_batch)
+        actual = fused.evaluate(test_batch)
+
+        assert actual.dtype == expected.dtype
+        np.testing.assert_array_equal(actual, expected)
+
+    @pytest.mark.parametrize("sql_operator, arguments", (
+        (SQLOperator.ADDITION, (Column('i'), Column('j'))),
+        (SQLOperator.LESS_THAN, (Column('f'), Literal(1))),
+        (SQLOperator.IN, (Column('i'), Literal([1, 0, 5]))),
+    ))
+    def test_not_fused_without_numba(self,
+                                     monkeypatch,
+                                     sql_operator,
+                                     arguments):
+        monkeypatch.setattr(fusion, 'numba', None)
+        assert _new_fused_expression(sql_operator, arguments) is None
+
+    def test_nested_fallback(self):
+        add = _new_fused_expression(SQLOperator.ADDITION,
+                                    (Column('f32'), Column('i32')))
+        cmp = _new_fused_expression(SQLOperator.GREATER_THAN,
+                                    (add, Literal(1)))
+        assert isinstance(cmp, FusedExpression)
+
+        f32 = np.array([0.5, np.nan, np.inf, -1.0], dtype=np.float32)
+        i32 = np.array([1, 2, 3, 4], dtype=np.int32)
+        np.testing.assert_array_equal(cmp.evaluate(test_batch),
+                                      (f32 + i32) > 1)
+
+    def test_nested_expressions(self):
+        add = _new_fused_expression(SQLOperator.ADDITION,
+                                    (Column('i'), Column('j')))
+        mul = _new_fused_expression(SQLOperator.MULTIPLICATION,
+                                    (add, Literal(2)))
+        cmp = _new_fused_expression(SQLOperator.LESS_THAN_OR_EQUAL,
+                                    (mul, Column('f')))
+        assert isinstance(cmp, FusedExpression)
+        assert len(cmp.columns) == 3
+
+        i = np.array([1, 2, 0, -4])
+        j = np.array([3, 0, 0, 7])
+        f = np.array([0.5, 0.0, np.nan, 3.0])
+        np.testing.assert_array_equal(cmp.evaluate(test_batch),
+                                      (i + j) * 2 <= f)
+
+    @pytest.mark.parametrize("sql_operator, arguments", (
+        (SQLOperator.MODULUS, (Column('i'), Literal(2))),
+        (SQLOperator.ADDITION, (Column('i'), Literal('a'))),
+        (SQLOperator.ADDITION, (Literal(1), Literal(2))),
+        (SQLOperator.AND, (Column('i'), Column('j'))),
+        (SQLOperator.NOT, (Column('i'),)),
+        (SQLOperator.IN, (Column('i'), Literal([]))),
+        (SQLOperator.IN, (Column('i'), Literal(list(range(17))))),
+        (SQLOperator.IN, (Column('i'), Literal([1, 'a']))),
+        (SQLOperator.ADDITION, (Column('i'), Literal(INT64_MAX + 1))),
+        (SQLOperator.LESS_THAN, (Column('f'), Literal(float('nan')))),
+    ))
+    def test_not_fused(self, sql_operator, arguments):
+        assert _new_fused_expression(sql_operator, arguments) is None
+
+    def test_boolean_expressions(self):
+        gt = _new_fused_expression(SQLOperator.GREATER_THAN,
+                                   (Column('i'), Literal(0)))
+        in_list = _new_fused_expression(SQLOperator.IN,
+                                        (Column('j'), Literal([0, 7])))
+        between = _new_fused_expression(
+            SQLOperator.BETWEEN, (Column('f'), Literal(0), Literal(1)))
+        or_ = _new_fused_expression(SQLOperator.OR, (gt, in_list))
+        and_ = _new_fused_expression(SQLOperator.AND, (or_, between))
+        not_ = _new_fused_expression(SQLOperator.NOT, (and_,))
+        assert isinstance(not_, FusedExpression)
+        assert len(not_.columns) == 3
+
+        i = np.array([1, 2, 0, -4])
+        j = np.array([3, 0, 0, 7])
+        f = np.array([0.5, 0.0, np.nan, 3.0])
+        np.testing.assert_array_equal(
+            not_.evaluate(test_batch),
+            ~(((i > 0) | np.isin(j, [0, 7])) & (f >= 0) & (f <= 1))
+        )
+
+    def test_shared_expression_is_not_fused(self):
+        add = _new_fused_expression(SQLOperator.ADDITION,
+                                    (Column('i'), Column('j')))
+        add.set_shared_id('shared_add')
+        assert _new_fused_expression(SQLOperator.MULTIPLICATION,
+                                     (add, Literal(2))) is None
@@ -1,5 +1,6 @@
 import pytest
 
+import vinum
 from vinum import read_csv, stream_csv, read_parquet
 from vinum.tests.conftest import csv_datafile, _assert_tables_equal
 
@@ -81,6 +82,17 @@ class TestQueryResults:
         actual_tbl = stream_csv(csv_datafile).sql(query)
         _assert_tables_equal(actual_tbl, expected_result)
 
+    @pytest.mark.parametrize("query, expected_result", QUERIES)
+    def test_open_csv_small_batches(self, query, expected_result,
+                                    csv_datafile):
+        default_batch_size = vinum.get_batch_size()
+        try:
+            vinum.set_batch_size(1000)
+            actual_tbl = stream_csv(csv_datafile).sql(query)
+            _assert_tables_equal(actual_tbl, expected_result)
+        finally:
+            vinum.set_batch_size(default_batch_size)
+
     @pytest.mark.parametrize("query, expected_result", QUERIES)
     def test_read_parquet(self, query, expected_result, parquet_datafile):
         actual_tbl = read_parquet(parquet_datafile).sql(query)
@@ -0,0 +1,119 @@
+import pytest
+
+import numpy as np
+import pyarrow as pa
+
+from vinum.arrow.record_batch import RecordBatch
+from vinum.core import functions, udf
+from vinum.core.functions import LikeFunction
+from vinum.parser.query import Column, Literal
+
+pytest.importorskip('numba')
+
+
+like_strings = ['', 'Joe', 'Jonas', 'Joseph', 'aXbYc', 'abc', 'a%b', 'Jo_e',
+                'Jo\ne', 'abc\n']
+
+like_batch = RecordBatch(pa.RecordBatch.from_arrays(
+    [
+        pa.array(like_strings),
+        pa.array(['Joe', 'x'] + like_strings).slice(2),
+        pa.array(['Jo', 'Zoë', 'Joe', '', 'a', 'ab', 'Jöe', 'Jo\ne', 'x',
+                  'abc\n']),
+    ],
+    names=['s', 'sliced', 'non_ascii']
+))
+
+
+class TestLikeKernel:
+
+    @pytest.mark.parametrize("column", ('s', 'sliced', 'non_ascii'))
+    @pytest.mark.parametrize("pattern", (
+        'Jo%', '%e', '%o%a%', 'J_e', 'Jo_e%', '%', '', '_', '_%_',
+        'a%b%c', '%b%', 'abc', '%X_Y%', 'Zo_', 'abc_', 'Jo%e',
+    ))
+    @pytest.mark.parametrize("invert", (False, True))
+    def test_same_result_without_numba(self,
+                                       monkeypatch,
+                                       column,
+                                       pattern,
+                                       invert):
+        arguments = (Column(column), Literal(pattern))
+        actual = LikeFunction(arguments, invert).evaluate(like_batch)
+
+        monkeypatch.setattr(functions, 'numba', None)
+        expected = LikeFunction(arguments, invert).evaluate(like_batch)
+
+        assert actual.dtype == np.bool_
+        np.testing.assert_array_equal(actual, expected)
+
+    @pytest.mark.parametrize("pattern", (
+        'Jo%', '%e', '%b%', 'abc', 'Jo\ne', '', '%',
+    ))
+    def test_string_methods_same_result_as_regex(self, pattern):
+        method, operand = LikeFunction._string_method(pattern)
+        assert method is not None
+        regex = LikeFunction._compile_regex_pattern(pattern)
+        for value in like_strings + ['Jo\ne', 'abc\n', '\nabc']:
+            assert (
+                method(value, operand)
+                == (regex.fullmatch(value) is not None)
+            ), value
+
+    def test_line_breaks_are_matched_by_kernel(self):
+        like = LikeFunction((Column('s'), Literal('Jo_e')), False)
+        column = like_batch.get_pa_column(Column('s'))
+        np.testing.assert_array_equal(
+            like._like_kernel(column, 'Jo_e'),
+            [value in ('Jo_e', 'Jo\ne') for value in like_strings]
+        )
+
+    def test_non_ascii_strings_are_not_matched(self):
+        like = LikeFunction((Column('non_ascii'), Literal('%o%')), False)
+        column = like_batch.get_pa_column(Column('non_ascii'))
+        assert like._like_kernel(column, '%o%') is None
+
+
+class TestPythonUdfKernel:
+
+    @pytest.mark.parametrize("function, args", (
+        (lambda x: x ** 3, (np.array([1, -2, 3]),)),
+        (lambda x: x * 2.5, (np.array([0.5, np.nan, np.inf]),)),
+        (lambda x, y: x > y, (np.array([1.0, np.nan]), np.array([0, 1]))),
+        (lambda x, y: x + y, (np.array([1, 2]), 3)),
+        (abs, (np.array([-1, 2]),)),
+    ))
+    def test_same_result_with_jit(self, function, args):
+        actual = udf._python_udf_kernel(function, jit=True)(*args)
+        expected = udf._python_udf_kernel(function)(*args)
+
+        assert actual.dtype == expected.dtype
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_not_compiled_by_default(self):
+        kernel = udf._python_udf_kernel(lambda x: 1 // x)
+        with pytest.raises(ZeroDivisionError):
+            kernel(np.array([1, 0]))
+
+    @pytest.mark.parametrize("jit", (False, True))
+    def test_exceptions_are_propagated(self, jit):
+        def positive(x):
+            if x < 0:
+                raise ValueError('negative')
+            return x
+
+        kernel = udf._python_udf_kernel(positive, jit=jit)
+        np.testing.assert_array_equal(kernel(np.array([1, 2])), (1, 2))
+        with pytest.raises(ValueError):
+            kernel(np.array([1, -1]))
+        # Strings can't be compiled, the Python function is called instead.
+        with pytest.raises(TypeError):
+            kernel(np.array(['a', 'b'], dtype=object))
+        np.testing.assert_array_equal(kernel(np.array([3])), (3,))
+
+    @pytest.mark.parametrize("jit", (False, True))
+    def test_strings(self, jit):
+        kernel = udf._python_udf_kernel(lambda x: x.upper(), jit=jit)
+        np.testing.assert_array_equal(
+            kernel(np.array(['a', 'Bc'], dtype=object)), ('A', 'BC')
+        )
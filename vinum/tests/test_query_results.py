@@ -1,9 +1,12 @@
+import threading
 from datetime import date, datetime
 
 import pytest
 
 import numpy as np
 
+import vinum
+from vinum.api.table import Table
 from vinum.core.udf import register_python, register_numpy
 from vinum.tests.conftest import (
     create_test_data,
@@ -16,6 +19,10 @@ from vinum.tests.conftest import (
 column_names, test_dict, test_table = create_test_data()
 groupby_column_names, test_groupby_table = create_test_groupby_data()
 _, __, test_table_null = create_null_test_data()
+test_table_line_breaks = Table.from_pydict({
+    'id': [1, 2, 3, 4],
+    'name': ['Joe', 'Jo\ne', 'abc\n', 'abc'],
+})
 
 queries = (
     (test_table,
@@ -158,6 +165,12 @@ queries = (
          'sum': (196.25,),
      }),
 
+    (test_table,
+     "select np.char.upper(name) as up from t where vendor_id = 1",
+     {
+         'up': ('JOE', 'JOSEPH'),
+     }),
+
     (test_table,
      "select * from t where vendor_id = 1",
      rows_to_columns_dict(
@@ -230,6 +243,67 @@ queries = (
          column_names
      )),
 
+    (test_table,
+     "select id from t where name like 'Jo_e%'",
+     {
+         'id': (3, 4),
+     }),
+
+    (test_table,
+     "select id from t where name not like '%o%a%'",
+     {
+         'id': (1, 3, 4),
+     }),
+
+    (test_table,
+     "select id from t where city_from like '%an_%'",
+     {
+         'id': (4,),
+     }),
+
+    # Wildcards match line breaks, whichever way the pattern is matched.
+    (test_table_line_breaks,
+     "select id from t where name like 'abc'",
+     {
+         'id': (4,),
+     }),
+
+    (test_table_line_breaks,
+     "select id from t where name like 'Jo%'",
+     {
+         'id': (1, 2),
+     }),
+
+    (test_table_line_breaks,
+     "select id from t where name like '%e'",
+     {
+         'id': (1, 2),
+     }),
+
+    (test_table_line_breaks,
+     "select id from t where name like '%c%'",
+     {
+         'id': (3, 4),
+     }),
+
+    (test_table_line_breaks,
+     "select id from t where name like 'J_%'",
+     {
+         'id': (1, 2),
+     }),
+
+    (test_table_line_breaks,
+     "select id from t where name like 'Jo_e'",
+     {
+         'id': (2,),
+     }),
+
+    (test_table_line_breaks,
+     "select id from t where name not like 'abc_'",
+     {
+         'id': (1, 2, 4),
+     }),
+
     (test_table,
      "select id from t where total between 10 and 100",
      {
@@ -254,6 +328,18 @@ queries = (
          'timestamp': (1596899421, 1598899424),
      }),
 
+    (test_table,
+     "select id from t where name in ('Joseph', 'Joe', 'Jo')",
+     {
+         'id': (1, 3, 4),
+     }),
+
+    (test_table,
+     "select id from t where city_from not in ('Riva', 'Berlin')",
+     {
+         'id': (2, 4),
+     }),
+
     (test_table,
      "select id from t where lat * 10 > 440",
      {
@@ -1422,6 +1508,15 @@ class TestQueryResults:
                              {
                                  'cube_np': (512, 343, 216, 125, 64, 27, 8, 1),
                              }),
+                pytest.param(test_table,
+                             'exclaim',
+                             lambda x: np.char.add(x, '!'),
+                             False,
+                             ("SELECT exclaim(city_from) from t "
+                              "WHERE vendor_id = 1"),
+                             {
+                                 'exclaim': ('Berlin!', 'Riva!'),
+                             }),
         )
     )
     def test_udfs(self,
@@ -1497,6 +1592,35 @@ class TestQueryResults:
         }
         _assert_tables_equal(actual_tbl, expected)
 
+    @pytest.mark.parametrize("parallel_safe", (False, True))
+    def test_udf_parallel_safe(self, parallel_safe):
+        threads = set()
+
+        def f_square(x):
+            threads.add(threading.current_thread())
+            return np.square(x)
+
+        register_numpy('udf_par', f_square, parallel_safe=parallel_safe)
+        default_batch_size = vinum.get_batch_size()
+        try:
+            # Split the table into several batches for the thread pool
+            vinum.set_batch_size(1)
+            actual_tbl = test_groupby_table.sql(
+                "select udf_par(id) as pow from t where id > 0 order by pow"
+            )
+        finally:
+            vinum.set_batch_size(default_batch_size)
+        expected = {
+            'pow': (1, 4, 9, 16, 25, 36, 49, 64),
+        }
+        _assert_tables_equal(actual_tbl, expected)
+        if parallel_safe:
+            assert any(
+                thread.name.startswith('vinum') for thread in threads
+            )
+        else:
+            assert threads == {threading.current_thread()}
+
     @pytest.mark.parametrize(
         "source_tbl, query",
         (
@@ -3,7 +3,10 @@ import pytest
 import pyarrow as pa
 import pandas as pd
 
+import vinum
 from vinum import Table
+from vinum.arrow.record_batch import RecordBatch
+from vinum.core.algebra import BaseReaderOperator
 from vinum.tests.conftest import _assert_tables_equal
 
 TEST_DATA_1 = (
@@ -63,3 +66,88 @@ class TestTableAPI:
     def test_schema(self, input, query, expected_result):
         schema = Table.from_pydict(input).schema
         assert isinstance(schema, pa.Schema)
+
+    @pytest.mark.parametrize("input, query, expected_result", TEST_DATA_1)
+    def test_batch_size(self, input, query, expected_result):
+        default_batch_size = vinum.get_batch_size()
+        try:
+            vinum.set_batch_size(1)
+            assert vinum.get_batch_size() == 1
+            actual_tbl = Table.from_pydict(input).sql(query)
+            _assert_tables_equal(actual_tbl, expected_result)
+        finally:
+            vinum.set_batch_size(default_batch_size)
+
+    def test_star_import(self):
+        namespace = {}
+        exec('from vinum import *', namespace)
+        assert set(vinum.__all__) <= set(namespace)
+        assert namespace['Table'] is Table
+        assert namespace['register_numpy'] is vinum.register_numpy
+
+    def test_dir(self):
+        assert set(vinum.__all__) <= set(dir(vinum))
+
+    @pytest.mark.parametrize("batch_size", (0, -1))
+    def test_invalid_batch_size(self, batch_size):
+        with pytest.raises(ValueError):
+            vinum.set_batch_size(batch_size)
+
+    @pytest.mark.parametrize("query, expected_result", (
+        ('select col1 from t limit 3 offset 4', {'col1': (4, 5, 6)}),
+        ('select col1 from t limit 2 offset 6', {'col1': (6, 7)}),
+        ('select col1 from t limit 5 offset 8', {'col1': (8, 9)}),
+        ('select col1 * 2 as x from t limit 3 offset 1', {'x': (2, 4, 6)}),
+    ))
+    def test_limit_offset_small_batches(self, query, expected_result):
+        default_batch_size = vinum.get_batch_size()
+        try:
+            vinum.set_batch_size(3)
+            tbl = Table.from_pydict({'col1': list(range(10))})
+            _assert_tables_equal(tbl.sql(query), expected_result)
+        finally:
+            vinum.set_batch_size(default_batch_size)
+
+
+class _BatchesReader(BaseReaderOperator):
+    def __init__(self, num_rows, batch_size):
+        super().__init__()
+        table = pa.table({'col1': list(range(num_rows))})
+        self._batches = table.to_batches(max_chunksize=batch_size)
+        self.num_read = 0
+
+    def _read(self):
+        for batch in self._batches:
+            self.num_read += 1
+            yield RecordBatch(batch)
+
+
+class TestReaderOperator:
+
+    @pytest.mark.parametrize(
+        "limit, offset, num_read, num_skipped, num_rows", (
+            (4, 1, 2, 0, 6),
+            (2, 4, 2, 3, 3),
+            (3, 0, 1, 0, 3),
+            (None, 4, 4, 3, 7),
+            (0, 0, 0, 0, 0),
+        )
+    )
+    def test_pushdown_limit_offset(self,
+                                   limit,
+                                   offset,
+                                   num_read,
+                                   num_skipped,
+                                   num_rows):
+        reader = _BatchesReader(10, 3)
+        reader.pushdown_limit_offset(limit, offset)
+        # The same plan may be executed more than once.
+        for _ in range(2):
+            reader.num_read = 0
+            assert sum(batch.num_rows for batch in reader.next()) == num_rows
+            assert reader.num_read == num_read
+            assert reader.num_skipped_rows == num_skipped
+
+    def test_read_is_abstract(self):
+        with pytest.raises(NotImplementedError):
+            list(BaseReaderOperator().next())
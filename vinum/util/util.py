@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 import pyarrow as pa
 
@@ -14,7 +16,7 @@ from typing import (
 
 
 if TYPE_CHECKING:
-    from vinum._typing import QueryBaseType
+    from vinum._typing import PyArrowArray, QueryBaseType
     from vinum.parser.query import Column, Expression
 
 TREE_INDENT_SYMBOL = '  '
@@ -133,6 +135,75 @@ def is_numpy_str_array(array: Any) -> bool:
     return is_numpy_array(array) and np.issubdtype(array.dtype, str)
 
 
+@lru_cache(maxsize=None)
+def _is_zero_copy_type(data_type: pa.DataType) -> bool:
+    """
+    Return True if Arrow array of this type without Nulls
+    can be converted to Numpy as a view.
+    """
+    return pa.types.is_integer(data_type) or pa.types.is_floating(data_type)
+
+
+def arrow_to_numpy(array: 'PyArrowArray',
+                   force_unicode_dtype: bool = False) -> np.ndarray:
+    """
+    Convert Arrow Array or ChunkedArray to Numpy array.
+
+    Parameters
+    ----------
+    array : PyArrowArray
+        Arrow array.
+    force_unicode_dtype : bool
+        Cast string arrays without Nulls to the fixed width unicode dtype,
+        as expected by ``np.char`` functions, rather than returning
+        them as 'object' typed arrays.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+    """
+    # The implementation below would make a copy of an array
+    # for non-numeric types or columns with Nulls.
+    # String columns are returned as 'object' typed numpy arrays,
+    # casting them to the fixed width unicode dtype would copy
+    # and pad every value to the length of the longest string,
+    # hence it is done only on request.
+    # TODO: is there a work-around to avoid making a copy?
+    if isinstance(array, pa.ChunkedArray) and array.num_chunks == 1:
+        # ChunkedArray.to_numpy always copies, a single chunk
+        # may be converted as a view instead.
+        array = array.chunk(0)
+
+    if isinstance(array, pa.ChunkedArray):
+        np_arr = array.to_numpy()
+    else:
+        # Check up front whether the zero-copy conversion is possible,
+        # rather than relying on ArrowInvalid being raised.
+        zero_copy = (array.null_count == 0
+                     and _is_zero_copy_type(array.type))
+        np_arr = array.to_numpy(zero_copy_only=zero_copy)
+
+    if (
+            force_unicode_dtype
+            and pa.types.is_string(array.type)
+            and array.null_count == 0
+    ):
+        np_arr = np_arr.astype('U')
+    return np_arr
+
+
+def numpy_to_arrow_mask(bitmask: np.ndarray) -> pa.Array:
+    """
+    Convert Numpy mask to Arrow BooleanArray.
+
+    Boolean Numpy arrays can't contain Nulls, hence the type inference
+    and the null sentinel checks are skipped.
+    """
+    if bitmask.dtype == np.bool_:
+        return pa.array(bitmask, type=pa.bool_(), from_pandas=False)
+    return pa.array(bitmask)
+
+
 def is_pyarrow_array(array: Any) -> bool:
     return isinstance(array, pa.Array) or isinstance(array, pa.ChunkedArray)
 